@@ -2,10 +2,12 @@ import os
 import re
 import hashlib
 import json
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timezone
 
 import gspread
+from gspread.utils import fill_gaps, numericise_all
 from google.auth.transport.requests import Request
 from google.oauth2.service_account import Credentials
 
@@ -215,6 +217,40 @@ def open_or_create_spreadsheet(
             ) from e
 
 
+def _get_worksheet(spreadsheet: gspread.Spreadsheet, sheet_name: str) -> gspread.Worksheet:
+    """시트 조회 결과를 Spreadsheet 객체에 메모이즈 (업로드 1회당 메타데이터 API 왕복 절감)
+
+    spreadsheet.worksheet()는 호출마다 메타데이터를 다시 조회하므로,
+    worksheets() 결과를 한 번만 받아 title -> Worksheet 맵으로 재사용합니다.
+    """
+    cache = getattr(spreadsheet, "_worksheet_cache", None)
+    if cache is None:
+        cache = {ws.title: ws for ws in spreadsheet.worksheets()}
+        spreadsheet._worksheet_cache = cache
+    ws = cache.get(sheet_name)
+    if ws is None:
+        ws = spreadsheet.worksheet(sheet_name)
+        cache[sheet_name] = ws
+    return ws
+
+
+def find_worksheet(spreadsheet: gspread.Spreadsheet, *keywords: str) -> Optional[gspread.Worksheet]:
+    """제목(소문자)에 keywords 중 하나가 포함된 첫 번째 시트를 반환 (없으면 None)
+
+    _get_worksheet와 같은 title -> Worksheet 메모이즈 맵을 사용하므로,
+    시트 이름을 유연하게 찾는 조회도 worksheets() API를 반복 호출하지 않습니다.
+    """
+    cache = getattr(spreadsheet, "_worksheet_cache", None)
+    if cache is None:
+        cache = {ws.title: ws for ws in spreadsheet.worksheets()}
+        spreadsheet._worksheet_cache = cache
+    for title, ws in cache.items():
+        title_lower = title.lower()
+        if any(keyword in title_lower for keyword in keywords):
+            return ws
+    return None
+
+
 def ensure_schema(spreadsheet: gspread.Spreadsheet) -> Dict[str, gspread.Worksheet]:
     """Ensure all required worksheets exist with headers.
 
@@ -229,6 +265,7 @@ def ensure_schema(spreadsheet: gspread.Spreadsheet) -> Dict[str, gspread.Workshe
         else:
             ws = spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=max(10, len(headers)))
         worksheets[sheet_name] = ws
+        existing[sheet_name] = ws
         # Set headers if first row is empty or different length
         current = ws.row_values(1)
         if not current or len(current) < len(headers):
@@ -237,9 +274,11 @@ def ensure_schema(spreadsheet: gspread.Spreadsheet) -> Dict[str, gspread.Workshe
     # Remove default empty sheet if not in REQUIRED_SHEETS
     if "Sheet1" in existing and "Sheet1" not in REQUIRED_SHEETS:
         try:
-            spreadsheet.del_worksheet(existing["Sheet1"])
+            spreadsheet.del_worksheet(existing.pop("Sheet1"))
         except Exception:
             pass
+    # 이후 ensure_*/delete_* 호출이 재사용하도록 시트 맵 캐시 갱신
+    spreadsheet._worksheet_cache = existing
     return worksheets
 
 
@@ -347,6 +386,37 @@ def save_response(spreadsheet: gspread.Spreadsheet, course_id: str, question_id:
     ws.append_row(values, value_input_option="USER_ENTERED")
 
 
+def save_responses_bulk(spreadsheet: gspread.Spreadsheet, course_id: str, answers: Dict[str, str], respondent_hash: str, session_id: str, ip_masked: str) -> int:
+    """Save all answers of one submission to the Responses sheet with a single append_rows call
+
+    Returns:
+        저장된 행 수
+    """
+    if not answers:
+        return 0
+
+    import uuid
+
+    ws = _get_worksheet(spreadsheet, "Responses")
+    timestamp = datetime.now(timezone.utc).isoformat()
+    # 💡 시각+순번 ID는 몇 ms 간격의 동시 제출끼리 범위가 겹치므로 행마다 uuid4 사용
+    rows = [
+        [
+            uuid.uuid4().hex,
+            course_id,
+            question_id,
+            answer,
+            timestamp,
+            respondent_hash,
+            session_id,
+            ip_masked,
+        ]
+        for question_id, answer in answers.items()
+    ]
+    ws.append_rows(rows, value_input_option="USER_ENTERED")
+    return len(rows)
+
+
 def update_response_stats(spreadsheet: gspread.Spreadsheet, course_id: str) -> None:
     """Update ResponseStats for a course (v2 compatible)"""
     try:
@@ -577,14 +647,22 @@ def get_course_items(spreadsheet: gspread.Spreadsheet, course_id: str) -> List[D
     mappings = ws_map.get_all_records()
     items = ws_items.get_all_records()
     
+    return _merge_course_items(mappings, items, course_id)
+
+
+def _merge_course_items(mappings: List[Dict], items: List[Dict], course_id: str) -> List[Dict]:
+    """Course_Item_Map 행과 Survey_Items 행을 합쳐 과정 문항 목록 생성 (order_in_course 순)"""
     # course_id에 해당하는 매핑만 필터
     course_mappings = [m for m in mappings if str(m.get("course_id")) == str(course_id)]
     
-    # item_id로 문항 정보 병합
+    # item_id로 문항 정보 병합 (같은 item_id가 여러 행이면 첫 행 사용)
+    items_by_id: Dict[str, Dict] = {}
+    for item in items:
+        items_by_id.setdefault(str(item.get("item_id")), item)
+    
     result = []
     for mapping in course_mappings:
-        item_id = str(mapping.get("item_id"))
-        item_info = next((i for i in items if str(i.get("item_id")) == item_id), {})
+        item_info = items_by_id.get(str(mapping.get("item_id")), {})
         
         # 매핑 정보 + 문항 정보 합치기
         combined = {**item_info, **mapping}
@@ -599,6 +677,45 @@ def get_course_items(spreadsheet: gspread.Spreadsheet, course_id: str) -> List[D
     return result
 
 
+def _values_to_records(values: List[List]) -> List[Dict]:
+    """시트 값 행렬(1행 = 헤더)을 get_all_records()와 같은 형태의 dict 리스트로 변환
+
+    💡 gspread.utils.to_records는 6.x에만 있으므로 5.x와 호환되도록 직접 조립합니다.
+    """
+    if not values:
+        return []
+    headers = values[0]
+    rows = fill_gaps(values[1:], cols=len(headers)) if len(values) > 1 else []
+    return [dict(zip(headers, numericise_all(row[:len(headers)]))) for row in rows]
+
+
+def batch_load_dashboard(spreadsheet: gspread.Spreadsheet, course_id: str) -> Tuple[Dict, List[Dict], List[Dict]]:
+    """
+    대시보드에 필요한 과정/문항/응답을 values.batchGet 1회로 조회
+
+    Courses, Course_Item_Map, Survey_Items, Responses 네 시트를 한 번의 API 호출로 읽어
+    get_course_by_id_v2 / get_course_items / 응답 조회와 같은 형태로 돌려줍니다.
+
+    Returns:
+        (course, course_items, course_responses) - 과정이 없으면 course는 빈 dict
+    """
+    sheet_names = ["Courses", "Course_Item_Map", "Survey_Items", "Responses"]
+    result = spreadsheet.values_batch_get([f"'{name}'" for name in sheet_names])
+    value_ranges = result.get("valueRanges", [])
+    courses, mappings, items, responses = (
+        _values_to_records(vr.get("values", [])) for vr in value_ranges
+    )
+
+    cid = str(course_id).strip()
+    course = next((row for row in courses if str(row.get("course_id", "")).strip() == cid), {})
+    course_items = _merge_course_items(mappings, items, course_id)
+    course_responses = [
+        r for r in responses
+        if str(r.get("course_id") or r.get("courseId")) == str(course_id)
+    ]
+    return course, course_items, course_responses
+
+
 def save_response_v2(spreadsheet: gspread.Spreadsheet, response: Dict[str, str]) -> None:
     """새 스키마: 응답 저장 (정규화된 형식)
     
@@ -635,6 +752,102 @@ def save_response_v2(spreadsheet: gspread.Spreadsheet, response: Dict[str, str])
     ws.append_row(ordered_values, value_input_option="USER_ENTERED")
 
 
+# Responses 헤더 순서대로 값을 꺼내는 행 변환기 (C로 구현된 itemgetter - 키 조회 루프 제거)
+_pack_response_row = itemgetter(*REQUIRED_SHEETS["Responses"])
+
+
+def _response_values(rows: List[Dict[str, str]]) -> List[list]:
+    """응답 dict 목록을 REQUIRED_SHEETS["Responses"] 헤더 순서의 값 행렬로 변환"""
+    headers = REQUIRED_SHEETS["Responses"]
+
+    # response_id가 없는 행은 한 번 구한 시각(μs)에 행 순번을 더해 채움 (행마다 시각 조회 X, 충돌 방지)
+    base_id = int(datetime.now(timezone.utc).timestamp() * 1000000)
+    values = []
+    for idx, response in enumerate(rows):
+        if not response.get("response_id"):
+            response["response_id"] = str(base_id + idx)
+        try:
+            values.append(list(_pack_response_row(response)))
+        except KeyError:
+            # 일부 열이 빠진 행은 기존 방식으로 빈 값 채움
+            values.append([response.get(col, "") for col in headers])
+    return values
+
+
+def _append_cells_request(ws: gspread.Worksheet, values: List[list]) -> Dict:
+    """spreadsheets.batchUpdate용 appendCells 요청 생성 (값 타입에 맞춰 셀 값 지정)"""
+    def _cell(value):
+        if value is None or value == "":
+            return {}
+        if isinstance(value, bool):
+            return {"userEnteredValue": {"boolValue": value}}
+        if isinstance(value, (int, float)):
+            return {"userEnteredValue": {"numberValue": value}}
+        return {"userEnteredValue": {"stringValue": str(value)}}
+
+    return {
+        "appendCells": {
+            "sheetId": ws.id,
+            "rows": [{"values": [_cell(v) for v in row]} for row in values],
+            "fields": "userEnteredValue",
+        }
+    }
+
+
+def save_submission_v2(
+    spreadsheet: gspread.Spreadsheet,
+    respondent: Dict[str, str],
+    rows: List[Dict[str, str]],
+) -> int:
+    """새 스키마: 설문 1회 제출분(신규 응답자 1명 + 응답 N건)을 API 호출 1회로 저장
+
+    Respondents/Responses 두 시트에 대한 appendCells 요청을 spreadsheets.batchUpdate 하나로 묶어 보냅니다.
+    기존 응답자 갱신은 하지 않으므로 새로 발급한 respondent_id에만 사용합니다.
+
+    Returns:
+        저장된 응답 행 수
+    """
+    ws_respondents = _get_worksheet(spreadsheet, "Respondents")
+    ws_responses = _get_worksheet(spreadsheet, "Responses")
+
+    requests = [
+        _append_cells_request(
+            ws_respondents, [[respondent.get(col, "") for col in REQUIRED_SHEETS["Respondents"]]]
+        )
+    ]
+    values = _response_values(rows)
+    if values:
+        requests.append(_append_cells_request(ws_responses, values))
+
+    spreadsheet.batch_update({"requests": requests})
+    return len(values)
+
+
+def save_responses_v2_bulk(
+    spreadsheet: gspread.Spreadsheet,
+    rows: List[Dict[str, str]],
+    chunk_size: int = 500,
+) -> int:
+    """새 스키마: 응답 여러 건을 append_rows로 일괄 저장
+
+    save_response_v2와 동일하게 REQUIRED_SHEETS["Responses"] 헤더 순서로 값을 정렬하되,
+    chunk_size 행마다 한 번의 API 호출로 기록합니다. (6000행 → 12회 쓰기)
+
+    Returns:
+        저장된 행 수
+    """
+    if not rows:
+        return 0
+
+    ws = _get_worksheet(spreadsheet, "Responses")
+    values = _response_values(rows)
+
+    for start in range(0, len(values), chunk_size):
+        ws.append_rows(values[start:start + chunk_size], value_input_option="USER_ENTERED")
+
+    return len(values)
+
+
 def save_respondent(spreadsheet: gspread.Spreadsheet, respondent: Dict[str, str]) -> None:
     """새 스키마: 응답자 정보 저장 (PII 분리)"""
     ws = spreadsheet.worksheet("Respondents")
@@ -656,6 +869,48 @@ def save_respondent(spreadsheet: gspread.Spreadsheet, respondent: Dict[str, str]
         ws.update(f"{target_index}:{target_index}", [values])
 
 
+def save_respondents_bulk(spreadsheet: gspread.Spreadsheet, respondents: List[Dict[str, str]]) -> int:
+    """
+    새 스키마: 응답자 정보 일괄 저장 (save_respondent의 일괄 버전)
+
+    기존 행은 한 번 읽어 respondent_id로 대조한 뒤, 신규 응답자는 append_rows 1회,
+    기존 응답자는 batch_update 1회로 갱신합니다.
+
+    Returns:
+        신규로 추가된 응답자 수
+    """
+    if not respondents:
+        return 0
+
+    ws = _get_worksheet(spreadsheet, "Respondents")
+    headers = REQUIRED_SHEETS["Respondents"]
+    existing_rows = {
+        str(row.get("respondent_id")): idx
+        for idx, row in enumerate(ws.get_all_records(), start=2)
+    }
+
+    new_values = []
+    updates = []
+    seen = set()
+    for respondent in respondents:
+        rid = str(respondent.get("respondent_id"))
+        if rid in seen:
+            continue
+        seen.add(rid)
+        values = [respondent.get(col, "") for col in headers]
+        target_index = existing_rows.get(rid)
+        if target_index is None:
+            new_values.append(values)
+        else:
+            updates.append({"range": f"{target_index}:{target_index}", "values": [values]})
+
+    if new_values:
+        ws.append_rows(new_values, value_input_option="USER_ENTERED")
+    if updates:
+        ws.batch_update(updates, value_input_option="USER_ENTERED")
+    return len(new_values)
+
+
 def get_responses_v2(spreadsheet: gspread.Spreadsheet, course_id: str = None, 
                      item_id: str = None, respondent_id: str = None) -> List[Dict[str, str]]:
     """새 스키마: 응답 조회 (다양한 필터 옵션)"""
@@ -1123,7 +1378,7 @@ def ensure_survey_items_from_headers(
     Returns:
         등록된 항목 정보 리스트 (item_id 포함)
     """
-    ws = spreadsheet.worksheet("Survey_Items")
+    ws = _get_worksheet(spreadsheet, "Survey_Items")
     all_items = ws.get_all_records()
     
     # 기존 item_code 목록
@@ -1201,7 +1456,7 @@ def ensure_course_item_mapping(
         course_id: 과정 ID
         item_list: 항목 리스트 (item_id 포함)
     """
-    ws = spreadsheet.worksheet("Course_Item_Map")
+    ws = _get_worksheet(spreadsheet, "Course_Item_Map")
     all_maps = ws.get_all_records()
     
     # 기존 매핑 확인
@@ -1242,7 +1497,7 @@ def delete_course_item_mappings(
 ) -> int:
     """특정 course_id와 매핑된 Course_Item_Map 행 삭제"""
 
-    ws = spreadsheet.worksheet("Course_Item_Map")
+    ws = _get_worksheet(spreadsheet, "Course_Item_Map")
     all_values = ws.get_all_values()
 
     if not all_values:
@@ -2,22 +2,34 @@ import os
 import hashlib
 import json
 from datetime import datetime, date as datetime_date, timedelta, timezone
-from typing import Dict, List
-from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict, defaultdict
 import io
+import random
+from concurrent.futures import ThreadPoolExecutor
+import re
+import threading
+import uuid
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+import plotly.io as pio
+from plotly.subplots import make_subplots
 import time
+from gspread.exceptions import APIError, WorksheetNotFound
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
 
 from gsheets_utils import (
     get_client,
     open_or_create_spreadsheet,
     ensure_schema,
+    find_worksheet,
     upsert_course,
     list_courses,
     list_questions,
@@ -25,7 +37,7 @@ from gsheets_utils import (
     delete_question,
     get_survey_settings,
     set_survey_active,
-    save_response,
+    save_responses_bulk,
     update_response_stats,
     get_course_by_id,
     get_responses_for_course,
@@ -36,10 +48,12 @@ from gsheets_utils import (
     list_courses_v2,
     get_course_by_id_v2,
     get_course_items,
+    batch_load_dashboard,
     upsert_survey_item,
     map_item_to_course,
-    save_response_v2,
-    save_respondent,
+    save_responses_v2_bulk,
+    save_submission_v2,
+    save_respondents_bulk,
     get_responses_v2,
     save_insight,
     get_insights,
@@ -56,6 +70,38 @@ from gsheets_utils import (
 
 APP_TITLE = "교육 설문 플랫폼"
 ADMIN_BADGE = "관리자 모드"
+RESPONSE_BATCH_SIZE = 500  # 업로드 시 append_rows 1회당 응답 행 수
+SUBJECTIVE_DISPLAY_LIMIT = 200  # 대시보드 주관식 응답 목록에 바로 표시할 최대 개수
+PIE_MAX_SLICES = 20  # 평점 분포를 파이 차트로 그릴 최대 항목 수 (초과 시 가로 막대)
+
+# AI 분석 결과 저장(Insights/Analysis 시트 쓰기)을 화면 렌더링과 분리해 처리하는 풀
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sheet-save")
+
+# 문항 유형(v2 metric_type / 레거시 type) → 분석 카테고리
+_QTYPE_MAP = {
+    "likert": "rating",
+    "nps": "rating",
+    "rating": "rating",
+    "single_choice": "objective",
+    "multi_choice": "objective",
+    "objective": "objective",
+    "text": "subjective",
+    "subjective": "subjective",
+}
+
+
+def _question_category(q: Dict, default: Optional[str] = None) -> Optional[str]:
+    """문항의 분석 카테고리 (rating / objective / subjective, 알 수 없으면 default)
+
+    💡 설문 폼 위젯 선택과 analyze_all 분류가 같은 함수를 쓰도록 해,
+       v2 metric_type이 rating/objective인 문항도 분석과 동일한 위젯(평점/선택)으로 응답받습니다.
+    """
+    raw_type = str(q.get('metric_type') or q.get('type') or '').strip().lower()
+    return _QTYPE_MAP.get(raw_type, default)
+
+# 대시보드 객관식 탭에서 제외할 경품/개인정보 관련 문항 키워드
+_EXCLUDE_KEYWORDS = frozenset(["경품", "개인정보", "동의", "수집", "이용", "제공", "consent", "privacy", "prize"])
+_EXCLUDE_RE = re.compile("|".join(map(re.escape, sorted(_EXCLUDE_KEYWORDS))), re.IGNORECASE)
 
 
 # ============================================================================
@@ -82,8 +128,11 @@ def generate_respondent_id() -> str:
 
 
 def generate_response_id() -> str:
-    """response_id 자동 생성"""
-    return f"R-{int(datetime.utcnow().timestamp() * 1000000)}"
+    """response_id 자동 생성
+
+    🚨 업로드는 버퍼에 연속으로 쌓아 저장하므로 마이크로초 타임스탬프는 중복될 수 있어 uuid4를 사용합니다.
+    """
+    return f"R-{uuid.uuid4().hex}"
 
 
 def generate_batch_id() -> str:
@@ -249,6 +298,87 @@ def safe_date(val) -> str:
         return s
 
 
+def _retry_after_seconds(err: Exception):
+    """API 오류 응답의 Retry-After 헤더(초)를 읽어 반환 (없으면 None)"""
+    response = getattr(err, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("Retry-After")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _dumps_json(obj) -> str:
+    """분석 결과 dict를 JSON 문자열로 직렬화 (orjson이 있으면 사용, 한글은 그대로 유지)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+# 재시도할 Sheets API 응답 코드 (쿼터 초과 / 일시적 서버 오류)
+_RETRYABLE_STATUS = (429, 500, 503)
+
+
+def _call_with_backoff(fn, *args, max_retries: int = 6, idempotent: bool = True,
+                       on_retry: Optional[Callable[[int, int, float], None]] = None, **kwargs):
+    """Sheets API 호출을 쿼터 초과/일시 오류 시 지수 백오프로 재시도 (화면 로그 없이 조용히 복구)
+
+    💡 on_retry(시도 번호, 최대 재시도 수, 대기 초)를 주면 대기 직전에 호출됩니다 (업로드 로그 등).
+    🚨 append처럼 다시 실행하면 행이 중복되는 쓰기는 idempotent=False로 호출하세요.
+       5xx는 서버에서 이미 반영됐을 수 있으므로, 반영 전에 거절된 429만 재시도합니다.
+    """
+    for i in range(max_retries + 1):
+        try:
+            return fn(*args, **kwargs)
+        except APIError as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            retryable = status in _RETRYABLE_STATUS if idempotent else status == 429
+            if not retryable or i == max_retries:
+                raise
+            # 서버가 Retry-After를 주면 우선 사용, 없으면 상한(32초) 있는 지수 백오프 + full jitter
+            # (쓰기 쿼터는 분 단위로 초기화되므로 전체 대기가 1분 안팎이 되도록, 동시 세션은 시점을 분산)
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = random.uniform(0, min(2 ** (i + 1), 32))
+            if on_retry is not None:
+                on_retry(i + 1, max_retries, delay)
+            time.sleep(delay)
+
+
+# CSV 인코딩 감지 실패 시 순서대로 시도할 후보
+_CSV_FALLBACK_ENCODINGS = ("utf-8-sig", "cp949", "euc-kr", "utf-8", "latin-1")
+
+
+def _detect_encoding(buf: bytes) -> str:
+    """CSV 바이트의 인코딩을 한 번에 추정 (BOM → UTF-8 → CP949 → charset_normalizer 순)
+
+    💡 인코딩마다 pd.read_csv 전체 파싱을 반복하지 않도록, 파싱 전에 먼저 추정합니다.
+    🚨 짧거나 모호한 한글 CSV는 charset_normalizer가 cp1252/latin-1 같은 단일 바이트 코덱으로
+       추정하기 쉽고, 이런 코덱은 디코딩 오류가 나지 않아 폴백 후보까지 가지 못합니다.
+       그래서 CP949로 엄격하게 디코딩되는지 먼저 확인합니다.
+    """
+    if buf[:3] == b"\xef\xbb\xbf":
+        return "utf-8-sig"
+    for encoding in ("utf-8", "cp949"):
+        try:
+            buf.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            pass
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        return "cp949"
+    best = from_bytes(buf[:65536]).best()
+    return (best.encoding if best else None) or "cp949"
+
+
+def _csv_encoding_candidates(detected: str) -> List[str]:
+    """감지된 인코딩을 맨 앞에 두고 나머지 후보를 뒤에 붙인 시도 순서"""
+    return [detected] + [e for e in _CSV_FALLBACK_ENCODINGS if e != detected]
+
+
 def read_uploaded_any(uploaded_file):
     """업로드된 파일을 안전하게 로드 (모든 시트 또는 CSV)
     
@@ -344,7 +474,7 @@ def read_uploaded_any(uploaded_file):
         elif filename.endswith(".csv"):
             # CSV는 단일 DF로 반환, 표준 인터페이스를 위해 dict로 감쌈
             df = None
-            for encoding in ["utf-8-sig", "cp949", "euc-kr", "utf-8"]:
+            for encoding in _csv_encoding_candidates(_detect_encoding(raw)):
                 try:
                     buf.seek(0)
                     df = pd.read_csv(buf, encoding=encoding, dtype=str)
@@ -492,21 +622,74 @@ def set_page_config():
     st.set_page_config(page_title=APP_TITLE, page_icon="📊", layout="wide")
 
 
+# Plotly 기본 템플릿: 모듈 로드 시 한 번만 등록 (SK 팔레트 색상 + simple_white)
+#   💡 Figure마다 template/색상을 지정하지 않고 pio 기본값을 공유
+pio.templates["sk"] = go.layout.Template(
+    layout=go.Layout(colorway=["#D90B31", "#F26680", "#020659", "#404040", "#D9D9D9"])
+)
+pio.templates.default = "simple_white+sk"
+
+
+# 파스텔 배경 장식 (선형 패턴 + 떠다니는 원) - 모듈 로드 시 한 번만 공백을 압축해 둠
+_BG_DECORATION_HTML = re.sub(r"\s+", " ", """
+<div class="ai-bg-decoration"></div>
+<style>
+  /* 선형 패턴 장식 */
+  .stApp::before {
+    content: '';
+    position: fixed;
+    top: 10%;
+    right: 5%;
+    width: 150px;
+    height: 150px;
+    background-image: 
+      repeating-linear-gradient(45deg, transparent, transparent 15px, rgba(168, 216, 234, 0.1) 15px, rgba(168, 216, 234, 0.1) 30px),
+      repeating-linear-gradient(-45deg, transparent, transparent 15px, rgba(212, 165, 216, 0.1) 15px, rgba(212, 165, 216, 0.1) 30px);
+    border-radius: 50%;
+    z-index: 0;
+    pointer-events: none;
+    animation: pattern-rotate 30s linear infinite;
+  }
+  
+  .stApp::after {
+    content: '';
+    position: fixed;
+    bottom: 15%;
+    left: 8%;
+    width: 100px;
+    height: 100px;
+    border: 3px solid var(--pastel-mint);
+    border-radius: 50%;
+    z-index: 0;
+    pointer-events: none;
+    animation: float 8s ease-in-out infinite;
+    opacity: 0.3;
+  }
+  
+  @keyframes pattern-rotate {
+    0% { transform: rotate(0deg); }
+    100% { transform: rotate(360deg); }
+  }
+  
+  @keyframes float {
+    0%, 100% { transform: translateY(0px) scale(1); }
+    50% { transform: translateY(-25px) scale(1.05); }
+  }
+</style>
+""").strip()
+
+
+def inject_background_decoration():
+    """배경 장식 HTML/CSS 주입
+
+    💡 Streamlit은 재실행마다 다시 그리지 않은 요소를 화면에서 제거하므로 매번 주입하되,
+       전송량을 줄이기 위해 미리 압축해 둔 문자열을 사용합니다.
+    """
+    st.markdown(_BG_DECORATION_HTML, unsafe_allow_html=True)
+
+
 def apply_global_styles():
     """Inject global CSS variables, fonts, and component theming for SK style."""
-    # Plotly theme defaults (colors align with SK palette)
-    try:
-        primary = "#D90B31"
-        secondary = "#404040"
-        accent1 = "#F26680"
-        accent2 = "#020659"
-        neutral = "#D9D9D9"
-        px.defaults.template = "plotly_white"
-        px.defaults.color_discrete_sequence = [
-    primary, accent1, accent2, secondary, neutral]
-    except Exception:
-        pass
-
     # Fonts: The Jamsil family (Noonnu CDN)
     st.markdown(
         """
@@ -884,6 +1067,7 @@ def page_setup_db(spreadsheet):
         if st.button("스키마 보증 실행"):
             with st.spinner("스키마 생성 중..."):
                 ensure_schema(spreadsheet)
+                _detect_schema_version.clear()
                 st.success("✅ 시트 스키마가 준비되었습니다.")
 
     with col2:
@@ -944,6 +1128,13 @@ def page_setup_db(spreadsheet):
     except Exception as e:
         st.error(f"시트 목록 조회 실패: {str(e)}")
 
+    # 대시보드 응답 로딩 진단 정보 (기본 비활성화)
+    # 🚨 위젯 key는 위젯이 화면에서 사라지면 삭제되므로, 페이지 이동 후에도 남도록 별도 키에 저장
+    st.session_state["debug_loader"] = st.checkbox(
+        "🔍 응답 로딩 디버그 정보 표시",
+        value=st.session_state.get("debug_loader", False),
+    )
+
 
 def _detect_uploaded_frames(uploaded_file) -> Dict[str, pd.DataFrame]:
     """업로드된 파일에서 Course/Questions/Responses를 자동 감지해 DataFrame으로 반환"""
@@ -979,19 +1170,10 @@ def _detect_uploaded_frames(uploaded_file) -> Dict[str, pd.DataFrame]:
             data = uploaded_file.read()
             buf = io.BytesIO(data)
             df = None
-            for enc in (
-    None,
-    "utf-8",
-    "utf-8-sig",
-    "cp949",
-    "euc-kr",
-     "latin1"):
+            for enc in _csv_encoding_candidates(_detect_encoding(data)):
                 try:
                     buf.seek(0)
-                    if enc is None:
-                        df = pd.read_csv(buf)
-                    else:
-                        df = pd.read_csv(buf, encoding=enc)
+                    df = pd.read_csv(buf, encoding=enc)
                     break
                 except Exception:
                     continue
@@ -1077,6 +1259,7 @@ def _normalize_response_row(row: Dict) -> Dict:
         "courseId": gs("courseId"),
         "questionId": gs("questionId"),
         "answer": gs("answer"),
+        # 💡 재업로드 시 같은 응답자로 대조되도록 기존 MD5 기반 해시 형식을 유지 (item_code와 동일한 이유)
         "respondentHash": gs("respondentHash", "import" + hashlib.md5(json.dumps(row, ensure_ascii=False).encode()).hexdigest()[:8]),
         "sessionId": gs("sessionId", "import_session"),
         "ipMasked": gs("ipMasked", "***.***.***.***"),
@@ -1084,6 +1267,17 @@ def _normalize_response_row(row: Dict) -> Dict:
     }
 
 
+def _to_numeric_list(values: List[str]) -> List:
+    """응답 문자열 목록을 한 번에 숫자로 변환 (변환 불가/빈 값은 None)
+
+    💡 행마다 float() + 예외 처리를 반복하지 않고 pd.to_numeric 1회 호출로 처리합니다.
+    """
+    if not values:
+        return []
+    nums = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+    return [None if pd.isna(n) else float(n) for n in nums.tolist()]
+
+
 def _is_metadata_column(column_text: str) -> bool:
     """메타데이터/PII 열인지 판단 (설문 문항이 아닌 응답자 정보)"""
     column_lower = column_text.lower()
@@ -1108,6 +1302,54 @@ def _is_metadata_column(column_text: str) -> bool:
     return False
 
 
+# 응답자 메타데이터 열 감지 패턴 (Respondents 시트 필드 → 헤더 패턴)
+# 💡 업로드에서 실제로 채우는 필드(company)만 등록합니다. 필드를 추가하면 respondent_rows에도 반영하세요.
+_META_PATTERNS = {
+    "company": re.compile(r"회사|소속|company", re.I),
+}
+
+
+def _is_xlsx(uploaded_file) -> bool:
+    """업로드 파일이 실제 XLSX(ZIP 기반)인지 판단
+
+    💡 확장자가 .xlsx/.xlsm이면 그대로 신뢰하고, 모호한 .csv일 때만 앞 2바이트(PK)를 확인합니다.
+    """
+    name = uploaded_file.name.lower()
+    if name.endswith((".xlsx", ".xlsm")):
+        return True
+    if name.endswith(".csv"):
+        pos = uploaded_file.tell()
+        magic = uploaded_file.read(2)
+        uploaded_file.seek(pos)
+        return magic == b"PK"
+    return False
+
+
+def _empty_wide_responses() -> Dict[str, List]:
+    """와이드 포맷 응답을 담는 열 단위(SoA) 배열 묶음 생성"""
+    return {"respondentIndex": [], "questionId": [], "answer": []}
+
+
+def _find_meta_columns(header_row: List[str]) -> Dict[str, int]:
+    """헤더 행에서 메타데이터 필드별 첫 번째 매칭 열 인덱스를 찾습니다"""
+    mapping: Dict[str, int] = {}
+    for col_idx, col in enumerate(header_row):
+        col_text = str(col)
+        for field, rx in _META_PATTERNS.items():
+            if field not in mapping and rx.search(col_text):
+                mapping[field] = col_idx
+    return mapping
+
+
+def _excel_cell_to_str(val) -> str:
+    """openpyxl 셀 값을 pd.read_excel(dtype=str)과 같은 형태의 문자열로 변환"""
+    if val is None:
+        return ""
+    if isinstance(val, float) and val.is_integer():
+        return str(int(val))
+    return str(val)
+
+
 def _parse_wide_excel_first_sheet(uploaded_file) -> Dict[str, List[Dict]]:
     """Parse an Excel where row1 columns are questions and row2+ are responses.
     
@@ -1115,32 +1357,34 @@ def _parse_wide_excel_first_sheet(uploaded_file) -> Dict[str, List[Dict]]:
 
     Returns dict with keys:
       - questions: List[Dict]
-      - responses: List[Dict] each has questionId, answer, respondentIndex
+      - responses: Dict[str, List] 열 단위 배열 (respondentIndex, questionId, answer - 같은 길이)
       - skipped_columns: List[str] (메타데이터로 건너뛴 열 목록)
+      - headers: List[str] (첫 행 원본 헤더, Survey_Items 자동 등록용)
+      - company_values: List[str] (respondentIndex 순 회사명 원본 값, 회사 열이 없으면 빈 리스트)
     """
-    result: Dict[str, List[Dict]] = {"questions": [], "responses": [], "skipped_columns": []}
+    result: Dict[str, List[Dict]] = {"questions": [], "responses": _empty_wide_responses(), "skipped_columns": [], "headers": [], "company_values": []}
+    wb = None
     try:
-        # Read into buffer to avoid consuming original pointer irreversibly
+        from openpyxl import load_workbook
+
+        # 💡 read_only 모드로 행 단위 스트리밍 (전체 시트를 DataFrame으로 만들지 않음)
         data = uploaded_file.read()
-        buf = io.BytesIO(data)
-        xls = pd.ExcelFile(buf, engine='openpyxl')
-        sheet_name = xls.sheet_names[0]
-        
-        # 🔧 dtype=str로 모든 데이터를 문자열로 읽어 형식 오류 방지
-        df = pd.read_excel(xls, sheet_name=sheet_name, header=None, engine='openpyxl', dtype=str)
-        if df.empty:
-            return result
+        wb = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+        ws = wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
 
         # First row -> question texts (skip first column: timestamp)
         header_row = []
         try:
-            header_row = df.iloc[0].fillna("").astype(str).tolist()
+            first_row = next(rows, None)
+            if first_row is None:
+                return result
+            header_row = [_excel_cell_to_str(v) for v in first_row]
         except Exception as e:
             st.warning(f"⚠️ 헤더 행 파싱 오류: {str(e)}")
             return result
-        
-        # Data rows -> responses
-        data_df = df.iloc[1:].reset_index(drop=True)
+        result["headers"] = header_row
+        company_col = _find_meta_columns(header_row).get("company")
 
         # Build questions (메타데이터 열 제외)
         questions: List[Dict] = []
@@ -1180,37 +1424,43 @@ def _parse_wide_excel_first_sheet(uploaded_file) -> Dict[str, List[Dict]]:
                 st.warning(f"⚠️ 열 {idx+1} 파싱 오류 (건너뜀): {str(e)}")
                 continue
 
-        # Build responses (개별 셀 오류 처리)
-        responses: List[Dict] = []
-        for ridx in range(len(data_df)):
+        # Build responses (개별 셀 오류 처리) - 행을 읽는 즉시 열 단위 배열에 추가
+        responses = _empty_wide_responses()
+        resp_idx_col, q_id_col, answer_col = responses["respondentIndex"], responses["questionId"], responses["answer"]
+        company_values: List[str] = []
+        for ridx, row in enumerate(rows):
             try:
-                row_series = data_df.iloc[ridx]
-                for cidx, val in enumerate(row_series.tolist()):
+                # 완전히 빈 행은 건너뜀 (행 번호는 유지)
+                if all(v is None for v in row):
+                    continue
+                for cidx, qid in col_to_qid.items():
                     try:
-                        if cidx not in col_to_qid:
-                            continue
+                        val = row[cidx] if cidx < len(row) else None
                         # 🔧 안전한 문자열 변환
-                        ans = "" if pd.isna(val) or val is None else str(val).strip()
-                        responses.append({
-                            "questionId": col_to_qid[cidx],
-                            "answer": ans,
-                            "respondentIndex": ridx,
-                        })
+                        ans = _excel_cell_to_str(val).strip()
+                        resp_idx_col.append(ridx)
+                        q_id_col.append(qid)
+                        answer_col.append(ans)
                     except Exception as cell_err:
                         # 개별 셀 오류는 건너뛰고 계속
                         continue
+                if company_col is not None:
+                    company_values.extend([""] * (ridx - len(company_values)))
+                    company_values.append(
+                        _excel_cell_to_str(row[company_col]) if company_col < len(row) else "")
             except Exception as row_err:
                 # 행 전체 오류는 로그만 남기고 계속
                 st.warning(f"⚠️ 행 {ridx+2} 파싱 오류 (건너뜀): {str(row_err)}")
                 continue
 
+        result["company_values"] = company_values
         result["questions"] = questions
         result["responses"] = responses
         result["skipped_columns"] = skipped_columns
         
         # 파싱 결과 요약
         if len(questions) > 0:
-            st.success(f"✅ 엑셀 파싱 성공: {len(questions)}개 문항, {len(responses)}개 응답")
+            st.success(f"✅ 엑셀 파싱 성공: {len(questions)}개 문항, {len(answer_col)}개 응답")
         
     except Exception as e:
         error_msg = str(e)
@@ -1241,6 +1491,8 @@ def _parse_wide_excel_first_sheet(uploaded_file) -> Dict[str, List[Dict]]:
             st.error(f"❌ wide 포맷 파싱 실패: {error_msg}")
             st.info("💡 파일을 **CSV 형식**으로 변환하여 재업로드를 권장합니다.")
     finally:
+        if wb is not None:
+            wb.close()
         try:
             uploaded_file.seek(0)
         except Exception:
@@ -1248,17 +1500,20 @@ def _parse_wide_excel_first_sheet(uploaded_file) -> Dict[str, List[Dict]]:
     return result
 
 
-def _parse_wide_csv(uploaded_file) -> Dict[str, List[Dict]]:
+def _parse_wide_csv(uploaded_file, encoding: str = None) -> Dict[str, List[Dict]]:
     """Parse a CSV where col1 is timestamp, row1 columns are questions (from col2), and row2+ are responses.
     
     🔧 안정성 강화: 개별 셀 오류를 건너뛰고 최대한 많은 데이터를 파싱합니다.
+    encoding을 넘기면 인코딩 감지를 생략하고 해당 인코딩부터 시도합니다.
 
     Returns dict with keys:
       - questions: List[Dict]
-      - responses: List[Dict] each has questionId, answer, respondentIndex
+      - responses: Dict[str, List] 열 단위 배열 (respondentIndex, questionId, answer - 같은 길이)
       - skipped_columns: List[str] (메타데이터로 건너뛴 열 목록)
+      - headers: List[str] (첫 행 원본 헤더, Survey_Items 자동 등록용)
+      - company_values: List[str] (respondentIndex 순 회사명 원본 값, 회사 열이 없으면 빈 리스트)
     """
-    result: Dict[str, List[Dict]] = {"questions": [], "responses": [], "skipped_columns": []}
+    result: Dict[str, List[Dict]] = {"questions": [], "responses": _empty_wide_responses(), "skipped_columns": [], "headers": [], "company_values": []}
     try:
         data = uploaded_file.read()
         buf = io.BytesIO(data)
@@ -1268,17 +1523,17 @@ def _parse_wide_csv(uploaded_file) -> Dict[str, List[Dict]]:
         encoding_used = None
         encoding_errors = []
         
-        # utf-8-sig를 먼저 시도해야 BOM(Byte Order Mark) 문제 해결
-        for encoding in ['utf-8-sig', 'cp949', 'euc-kr', 'utf-8', 'latin-1']:
+        # 감지된 인코딩으로 한 번 파싱하고, 실패할 때만 나머지 후보를 시도
+        for enc in _csv_encoding_candidates(encoding or _detect_encoding(data)):
             try:
                 buf.seek(0)
                 # 🔧 dtype=str로 모든 데이터를 문자열로 읽어 형식 오류 방지
-                df = pd.read_csv(buf, header=None, encoding=encoding, dtype=str, on_bad_lines='skip')
-                encoding_used = encoding
+                df = pd.read_csv(buf, header=None, encoding=enc, dtype=str, on_bad_lines='skip')
+                encoding_used = enc
                 st.success(f"✅ CSV 인코딩 감지 성공: {encoding_used}")
                 break
             except Exception as e:
-                encoding_errors.append(f"{encoding}: {str(e)[:50]}")
+                encoding_errors.append(f"{enc}: {str(e)[:50]}")
                 continue
         
         if df is None or df.empty:
@@ -1296,6 +1551,13 @@ def _parse_wide_csv(uploaded_file) -> Dict[str, List[Dict]]:
         except Exception as e:
             st.warning(f"⚠️ CSV 헤더 행 파싱 오류: {str(e)}")
             return result
+        result["headers"] = header_row
+        company_col = _find_meta_columns(header_row).get("company")
+        if company_col is not None:
+            result["company_values"] = [
+                "" if v is None or v != v else str(v)
+                for v in df.iloc[1:, company_col].to_numpy(dtype=object)
+            ]
         
         # Data rows -> responses
         data_df = df.iloc[1:].reset_index(drop=True)
@@ -1336,22 +1598,19 @@ def _parse_wide_csv(uploaded_file) -> Dict[str, List[Dict]]:
                 continue
 
         # Build responses (개별 셀 오류 처리)
-        responses: List[Dict] = []
-        for ridx in range(len(data_df)):
+        # 💡 행마다 .iloc로 Series를 만들지 않고 numpy 배열을 한 번만 순회 (결과는 열 단위 배열)
+        responses = _empty_wide_responses()
+        resp_idx_col, q_id_col, answer_col = responses["respondentIndex"], responses["questionId"], responses["answer"]
+        for ridx, row in enumerate(data_df.to_numpy(dtype=object)):
             try:
-                row_series = data_df.iloc[ridx]
-                for cidx in range(1, len(row_series)):
+                for cidx, qid in col_to_qid.items():
                     try:
-                        if cidx not in col_to_qid:
-                            continue
-                        val = row_series.iloc[cidx]
-                        # 🔧 안전한 문자열 변환
-                        ans = "" if pd.isna(val) or val is None else str(val).strip()
-                        responses.append({
-                            "questionId": col_to_qid[cidx],
-                            "answer": ans,
-                            "respondentIndex": ridx,
-                        })
+                        val = row[cidx]
+                        # 🔧 안전한 문자열 변환 (NaN != NaN 이므로 결측값 판별)
+                        ans = "" if val is None or val != val else str(val).strip()
+                        resp_idx_col.append(ridx)
+                        q_id_col.append(qid)
+                        answer_col.append(ans)
                     except Exception as cell_err:
                         # 개별 셀 오류는 건너뛰고 계속
                         continue
@@ -1366,7 +1625,7 @@ def _parse_wide_csv(uploaded_file) -> Dict[str, List[Dict]]:
         
         # 파싱 결과 요약
         if len(questions) > 0:
-            st.success(f"✅ CSV 파싱 성공 ({encoding_used}): {len(questions)}개 문항, {len(responses)}개 응답")
+            st.success(f"✅ CSV 파싱 성공 ({encoding_used}): {len(questions)}개 문항, {len(answer_col)}개 응답")
         
     except Exception as e:
         st.error(f"❌ CSV wide 포맷 파싱 실패: {str(e)}")
@@ -1379,6 +1638,90 @@ def _parse_wide_csv(uploaded_file) -> Dict[str, List[Dict]]:
     return result
 
 
+def _match_headers_to_items(q_texts: List[str], i_texts: List[str], threshold: int = 60) -> List[int]:
+    """
+    파일 헤더 텍스트 목록을 Survey_Items의 item_text 목록과 매칭합니다.
+    각 헤더에 대해 가장 유사한 item의 인덱스를 반환하며, 매칭 실패 시 -1입니다.
+
+    💡 먼저 앞 50자 prefix 인덱스(dict)로 O(1) 정확 매칭을 하고, 남은 헤더만
+       rapidfuzz process.cdist(token_sort_ratio)로 점수 행렬을 계산합니다.
+       token_set_ratio는 한쪽 토큰이 다른 쪽의 부분집합이면 100점을 주어("만족도" ↔ "강사 만족도"/
+       "교육 만족도") 엉뚱한 문항에 매칭될 수 있으므로 쓰지 않고, 최고점이 여러 개면 매칭하지 않습니다.
+       rapidfuzz가 없으면 기존의 앞 50자 포함 비교로 대체합니다.
+    """
+    matches = [-1] * len(q_texts)
+    if not q_texts or not i_texts:
+        return matches
+
+    # 앞 50자 slice는 한 번만 계산해 prefix 인덱스와 fallback 비교에 공통 사용
+    i_prefixed = [(j, item_text[:50], item_text) for j, item_text in enumerate(i_texts) if item_text]
+    prefix_index: Dict[str, int] = {}
+    for j, item_50, _ in i_prefixed:
+        prefix_index.setdefault(item_50, j)
+
+    remaining = []
+    for i, q_text in enumerate(q_texts):
+        if not q_text:
+            continue
+        hit = prefix_index.get(q_text[:50])
+        if hit is not None:
+            matches[i] = hit
+        else:
+            remaining.append(i)
+    if not remaining:
+        return matches
+
+    try:
+        from rapidfuzz import process, fuzz, utils
+    except ImportError:
+        for i in remaining:
+            q_text = q_texts[i]
+            q_text_50 = q_text[:50]
+            for j, item_50, item_text in i_prefixed:
+                if q_text_50 in item_text or item_50 in q_text:
+                    matches[i] = j
+                    break
+        return matches
+
+    scores = process.cdist(
+        [q_texts[i] for i in remaining],
+        i_texts,
+        scorer=fuzz.token_sort_ratio,
+        processor=utils.default_process,
+        workers=-1,
+    )
+    best = scores.argmax(axis=1)
+    best_scores = scores[range(len(remaining)), best]
+    best_counts = (scores == best_scores[:, None]).sum(axis=1)
+    for i, j, score, count in zip(remaining, best, best_scores, best_counts):
+        if score >= threshold and count == 1:
+            matches[i] = int(j)
+    return matches
+
+
+def _parse_wide_cached(uploaded_file, is_excel: bool, encoding: str = None) -> Dict[str, List[Dict]]:
+    """와이드 포맷 파싱 결과를 파일 해시 단위로 세션에 캐시
+
+    Streamlit은 위젯 조작마다 스크립트를 재실행하므로, 동일한 파일 바이트에 대해서는
+    첫 파싱 결과를 재사용해 미리보기/업로드 단계의 반복 파싱을 막습니다.
+    """
+    file_hash = hashlib.blake2b(uploaded_file.getvalue(), digest_size=16).hexdigest()
+    cache_key = (file_hash, "xlsx" if is_excel else "csv")
+    cache = st.session_state.setdefault("_wide_parse_cache", {})
+
+    if cache_key not in cache:
+        parsed = _parse_wide_excel_first_sheet(uploaded_file) if is_excel else _parse_wide_csv(uploaded_file, encoding)
+        if not parsed.get("questions"):
+            return parsed  # 실패 결과는 캐시하지 않음
+        # 업로드된 파일이 바뀌면 이전 파싱 결과는 더 이상 필요 없음
+        cache.clear()
+        cache[cache_key] = parsed
+
+    cached = cache[cache_key]
+    # 업로드 단계에서 questionId를 item_id로 교체하므로 문항 dict는 복사본을 반환
+    return {**cached, "questions": [dict(q) for q in cached["questions"]]}
+
+
 def page_upload_files(spreadsheet):
     """관리자: 설문 파일 업로드 (문항만 또는 응답 포함)"""
     st.subheader("설문 파일 업로드 (CSV/XLSX)")
@@ -1438,10 +1781,8 @@ def page_upload_files(spreadsheet):
             ".csv") or uploaded.name.lower().endswith(".xlsx")):
             st.markdown("**와이드 포맷 감지**: 1행 문항, 2행부터 응답")
             try:
-                if uploaded.name.lower().endswith(".csv"):
-                    preview = _parse_wide_csv(uploaded)
-                else:
-                    preview = _parse_wide_excel_first_sheet(uploaded)
+                preview = _parse_wide_cached(
+                    uploaded, is_excel=_is_xlsx(uploaded))
                 q_texts = [q.get("text", "")
                                  for q in preview.get("questions", [])]
                 st.markdown(f"**문항 수: {len(q_texts)}개**")
@@ -1585,29 +1926,28 @@ def page_upload_files(spreadsheet):
         # ============================================
         try:
             log_box = st.expander("업로드 로그", expanded=False)
-            # Helper: exponential backoff wrapper with API quota handling
+            # Helper: 공통 백오프(_call_with_backoff)에 업로드 로그 출력만 더한 래퍼
+            def _log_retry(attempt: int, max_retries: int, delay: float):
+                with log_box:
+                    st.write(f"⚠️ API 쿼터 초과/일시 오류 감지 (시도 {attempt}/{max_retries})")
+                    st.write(f"⏳ {delay:.1f}초 대기 중...")
 
             def _with_backoff(fn, *args, **kwargs):
-                delays = [2, 4, 8, 16, 32]  # Increased delays for quota limits
-                last_err = None
-                for i, d in enumerate([0] + delays):
-                    if d:
-                        time.sleep(d)
-                        with log_box:
-                            st.write(f"⏳ API 쿼터 제한으로 {d}초 대기 중...")
-                    try:
-                        return fn(*args, **kwargs)
-                    except Exception as e:
-                        msg = str(e)
-                        last_err = e
-                        if ("429" in msg) or ("Quota exceeded" in msg) or (
-                            "quota" in msg.lower()):
-                            with log_box:
-                                st.write(
-                                    f"⚠️ API 쿼터 초과 감지 (시도 {i + 1}/{len(delays)})")
-                            continue
-                        raise
-                raise last_err
+                return _call_with_backoff(fn, *args, on_retry=_log_retry, **kwargs)
+
+            # 응답 일괄 저장 버퍼 (RESPONSE_BATCH_SIZE 행마다 append_rows 1회)
+            # 💡 로그도 행마다 st.write 하지 않고 저장 시점에 한 번에 출력 (프론트엔드 갱신 최소화)
+            pending_responses: List[Dict] = []
+            pending_log_lines: List[str] = []
+
+            def _flush_responses():
+                if pending_responses:
+                    _with_backoff(save_responses_v2_bulk, spreadsheet, pending_responses, idempotent=False)
+                    pending_responses.clear()
+                if pending_log_lines:
+                    with log_box:
+                        st.text("\n".join(pending_log_lines))
+                    pending_log_lines.clear()
 
             # 3) Course 저장 (v2 스키마 사용)
             course_saved_id = None
@@ -1664,35 +2004,78 @@ def page_upload_files(spreadsheet):
             course_obj_v2['session_no']} / 날짜: {
                 course_obj_v2['event_date']}")
 
+            # 🔧 실제 파일 형식 감지 - 한 번만 확인해 이후 단계에서 재사용
+            is_zip_based = _is_xlsx(uploaded)
+            # CSV 인코딩도 한 번만 감지해 와이드 파싱/헤더 추출에 공통 사용
+            file_encoding = None if is_zip_based else _detect_encoding(uploaded.getvalue())
+
+            # 2) Questions 저장 (표준 또는 와이드 포맷)
+            imported_questions = 0
+            wide_result = {"questions": [], "responses": _empty_wide_responses()}
+            
+            # 💡 와이드 포맷 파싱 시작 (파일 1회 파싱 → 헤더/응답/메타데이터 모두 재사용)
+            if use_wide_format:
+                if is_zip_based:
+                    # 실제로 XLSX 파일 (확장자와 무관하게)
+                    with log_box:
+                        st.write("📊 엑셀 와이드 포맷 파싱 중...")
+                        st.info(f"💡 파일 시그니처: XLSX (실제 확장자: {uploaded.name.split('.')[-1]})")
+                        if not uploaded.name.lower().endswith(".xlsx"):
+                            st.warning("⚠️ 파일 확장자는 .csv이지만 실제로는 XLSX 파일입니다!")
+                    
+                    wide_result = _parse_wide_cached(uploaded, is_excel=True)
+                    
+                    # 파싱 실패 시 (questions가 없으면)
+                    if not wide_result.get("questions"):
+                        st.error("❌ XLSX 파일 파싱 실패!")
+                        st.error("🚨 **필수 조치**: Excel에서 파일을 열고 CSV UTF-8로 저장 후 재업로드하세요!")
+                        return
+                    
+                    # 🚨 메타데이터 열 건너뛰기 알림
+                    if wide_result.get("skipped_columns"):
+                        with log_box:
+                            st.info(f"📋 메타데이터/PII 열 건너뛰기: {len(wide_result['skipped_columns'])}개")
+                            with st.expander("🔍 건너뛴 열 목록 보기"):
+                                st.code("\n".join(f"- {c}" for c in wide_result["skipped_columns"]))
+                                st.caption("💡 이 열들은 응답자 개인정보로 간주되어 문항으로 등록되지 않았습니다.")
+                else:
+                    # 실제로 CSV 파일 (가장 안정적)
+                    with log_box:
+                        st.write("📊 CSV 와이드 포맷 파싱 중...")
+                        st.info("💡 파일 시그니처: CSV")
+                    
+                    wide_result = _parse_wide_cached(uploaded, is_excel=False, encoding=file_encoding)
+                    
+                    # 🚨 메타데이터 열 건너뛰기 알림
+                    if wide_result.get("skipped_columns"):
+                        with log_box:
+                            st.info(f"📋 메타데이터/PII 열 건너뛰기: {len(wide_result['skipped_columns'])}개")
+                            with st.expander("🔍 건너뛴 열 목록 보기"):
+                                st.code("\n".join(f"- {c}" for c in wide_result["skipped_columns"]))
+                                st.caption("💡 이 열들은 응답자 개인정보로 간주되어 문항으로 등록되지 않았습니다.")
+            
             # 4) 헤더 기반 Survey_Items 자동 등록 및 매핑
             with log_box:
                 st.write("📝 파일 헤더 추출 중...")
 
-            # 파일 다시 읽기 (헤더 추출용)
             try:
-                # 파일 포인터를 처음으로 되돌리기
-                uploaded.seek(0)
-
-                # 🔧 파일 시그니처 확인 (실제 파일 형식 감지)
-                file_content = uploaded.read()
-                uploaded.seek(0)
-                
-                is_zip_based = file_content[:2] == b'PK'  # ZIP/XLSX 시그니처
-                
-                if is_zip_based:
+                if use_wide_format:
+                    # 와이드 포맷은 이미 파싱된 첫 행을 그대로 사용 (파일 재파싱 없음)
+                    headers = [str(h).strip() for h in wide_result.get("headers", [])]
+                elif is_zip_based:
                     # 실제로 XLSX 파일
                     with log_box:
                         st.info("💡 파일 시그니처 확인: XLSX 형식 (ZIP 기반)")
-                    df_headers = pd.read_excel(io.BytesIO(file_content), nrows=0, engine='openpyxl')
+                    df_headers = pd.read_excel(io.BytesIO(uploaded.getvalue()), nrows=0, engine='openpyxl')
                 else:
                     # 실제로 CSV 파일 - 다중 인코딩 시도
                     with log_box:
                         st.info("💡 파일 시그니처 확인: CSV 형식")
                     
                     df_headers = None
-                    for encoding in ['utf-8-sig', 'cp949', 'euc-kr', 'utf-8', 'latin-1']:
+                    for encoding in _csv_encoding_candidates(file_encoding):
                         try:
-                            df_headers = pd.read_csv(io.BytesIO(file_content), nrows=0, encoding=encoding)
+                            df_headers = pd.read_csv(io.BytesIO(uploaded.getvalue()), nrows=0, encoding=encoding)
                             with log_box:
                                 st.success(f"✅ 헤더 읽기 성공: {encoding}")
                             break
@@ -1702,7 +2085,8 @@ def page_upload_files(spreadsheet):
                     if df_headers is None:
                         raise ValueError("CSV 헤더를 읽을 수 없습니다. 파일 인코딩을 확인하세요.")
 
-                headers = list(df_headers.columns)
+                if not use_wide_format:
+                    headers = list(df_headers.columns)
 
                 with log_box:
                     st.write(f"📋 총 {len(headers)}개 컬럼 발견")
@@ -1757,60 +2141,6 @@ def page_upload_files(spreadsheet):
                     st.warning(f"⚠️ 헤더 기반 자동 등록 실패: {str(e)}")
                     st.write("💡 수동으로 Survey_Items를 등록해야 할 수 있습니다.")
 
-            # 2) Questions 저장 (표준 또는 와이드 포맷)
-            imported_questions = 0
-            wide_result = {"questions": [], "responses": []}
-            
-            # 💡 와이드 포맷 파싱 시작 - 파일 시그니처로 실제 형식 감지
-            if use_wide_format:
-                # 🔧 파일 시그니처로 실제 형식 확인
-                uploaded.seek(0)
-                file_magic = uploaded.read(4)
-                uploaded.seek(0)
-                
-                is_zip_based = file_magic[:2] == b'PK'
-                
-                if is_zip_based:
-                    # 실제로 XLSX 파일 (확장자와 무관하게)
-                    with log_box:
-                        st.write("📊 엑셀 와이드 포맷 파싱 중...")
-                        st.info(f"💡 파일 시그니처: XLSX (실제 확장자: {uploaded.name.split('.')[-1]})")
-                        if not uploaded.name.lower().endswith(".xlsx"):
-                            st.warning("⚠️ 파일 확장자는 .csv이지만 실제로는 XLSX 파일입니다!")
-                    
-                    wide_result = _parse_wide_excel_first_sheet(uploaded)
-                    
-                    # 파싱 실패 시 (questions가 없으면)
-                    if not wide_result.get("questions"):
-                        st.error("❌ XLSX 파일 파싱 실패!")
-                        st.error("🚨 **필수 조치**: Excel에서 파일을 열고 CSV UTF-8로 저장 후 재업로드하세요!")
-                        return
-                    
-                    # 🚨 메타데이터 열 건너뛰기 알림
-                    if wide_result.get("skipped_columns"):
-                        with log_box:
-                            st.info(f"📋 메타데이터/PII 열 건너뛰기: {len(wide_result['skipped_columns'])}개")
-                            with st.expander("🔍 건너뛴 열 목록 보기"):
-                                for col in wide_result["skipped_columns"]:
-                                    st.write(f"   - {col}")
-                                st.caption("💡 이 열들은 응답자 개인정보로 간주되어 문항으로 등록되지 않았습니다.")
-                else:
-                    # 실제로 CSV 파일 (가장 안정적)
-                    with log_box:
-                        st.write("📊 CSV 와이드 포맷 파싱 중...")
-                        st.info("💡 파일 시그니처: CSV")
-                    
-                    wide_result = _parse_wide_csv(uploaded)
-                    
-                    # 🚨 메타데이터 열 건너뛰기 알림
-                    if wide_result.get("skipped_columns"):
-                        with log_box:
-                            st.info(f"📋 메타데이터/PII 열 건너뛰기: {len(wide_result['skipped_columns'])}개")
-                            with st.expander("🔍 건너뛴 열 목록 보기"):
-                                for col in wide_result["skipped_columns"]:
-                                    st.write(f"   - {col}")
-                                st.caption("💡 이 열들은 응답자 개인정보로 간주되어 문항으로 등록되지 않았습니다.")
-            
             # 💡 와이드 포맷 Questions 등록 (Excel/CSV 공통 처리)
             # 🚨 핵심 수정: 파일 헤더 텍스트를 registered_items의 item_text와 매핑하여 실제 item_id 사용
             question_text_to_item_id = {}  # 매핑 딕셔너리
@@ -1821,18 +2151,13 @@ def page_upload_files(spreadsheet):
                     with log_box:
                         st.write("🔍 파일 헤더를 Survey_Items의 item_id와 매핑 중...")
                     
-                    for q in wide_result["questions"]:
-                        q_text = q.get("text", "").strip()
-                        # registered_items에서 매칭되는 item_text 찾기
-                        matched_item = None
-                        for item in registered_items:
-                            item_text = item.get("item_text", "").strip()
-                            # 텍스트 유사도 비교 (정규화된 비교)
-                            if q_text and item_text:
-                                # 간단한 매칭: 앞 50자 비교 또는 전체 텍스트 포함 여부
-                                if q_text[:50] in item_text or item_text[:50] in q_text:
-                                    matched_item = item
-                                    break
+                    # registered_items에서 매칭되는 item_text 찾기 (점수 행렬 1회 계산)
+                    q_texts = [q.get("text", "").strip() for q in wide_result["questions"]]
+                    i_texts = [item.get("item_text", "").strip() for item in registered_items]
+                    match_idx = _match_headers_to_items(q_texts, i_texts)
+                    
+                    for q, q_text, j in zip(wide_result["questions"], q_texts, match_idx):
+                        matched_item = registered_items[j] if j >= 0 else None
                         
                         if matched_item:
                             # 매핑 성공: 실제 item_id 사용
@@ -1856,6 +2181,7 @@ def page_upload_files(spreadsheet):
                 imported_questions = len(wide_result["questions"])
             elif has_questions:
                 q_df = dfs["questions"].fillna("")
+                question_log_lines: List[str] = []
                 for _, r in q_df.iterrows():
                     q = _normalize_question_row(r.to_dict())
                     if not q.get("courseId"):
@@ -1867,170 +2193,149 @@ def page_upload_files(spreadsheet):
                     # Add delay every 10 questions to avoid quota limits
                     if imported_questions % 10 == 0:
                         time.sleep(1)
+                    question_log_lines.append(
+                        f"Questions 등록: questionId={q['questionId']}, "
+                        f"order={q['order']}, text='{q.get('text', '')[:60]}'"
+                    )
+                if question_log_lines:
                     with log_box:
-                        st.write(
-    f"Questions 등록: questionId={
-        q['questionId']}, order={
-            q['order']}, text='{
-                q.get(
-                    'text', '')[
-                        :60]}'")
+                        st.text("\n".join(question_log_lines))
 
             # 3) Responses 저장 (표준 또는 와이드 포맷) - v2 스키마 사용
             imported_responses = 0
-            if use_wide_format and wide_result["responses"]:
-                # 각 응답자 묶음별로 동일 respondent_id를 유지하기 위해 index 단위로 그룹핑
-                from collections import defaultdict
-                idx_to_resps = defaultdict(list)
-                for r in wide_result["responses"]:
-                    idx_to_resps[r["respondentIndex"]].append(r)
+            # 한 번의 업로드는 하나의 배치: 타임스탬프/배치 ID를 모든 행에 공통 적용
+            batch_ts = datetime.now(timezone.utc).isoformat()
+            batch_id = generate_batch_id()
+            if use_wide_format and wide_result["responses"]["answer"]:
+                # 열 단위 응답 배열을 응답자(respondentIndex) 순으로 정렬 - 같은 응답자의 행이 연속되도록
+                df_r = pd.DataFrame(wide_result["responses"]).sort_values("respondentIndex", kind="stable")
+                respondent_indices = df_r["respondentIndex"].unique().tolist()
+                # 빈 응답은 분석 가치가 없으므로 저장하지 않음 (시트 쿼터/용량 절약)
+                blank_mask = df_r["answer"].str.strip() == ""
+                if blank_mask.any():
+                    df_r = df_r[~blank_mask]
+                    with log_box:
+                        st.write(f"⏭️ 빈 응답 {int(blank_mask.sum())}개 건너뜀")
+                # 숫자 응답 값은 전체 응답에 대해 한 번에 변환
+                answer_nums = _to_numeric_list(df_r["answer"].tolist())
                 
                 # 🆕 원본 데이터에서 응답자 메타데이터(회사명 등) 추출을 위한 준비
                 respondent_metadata = {}  # {respondent_index: {"company": "...", ...}}
                 
                 try:
-                    # 원본 파일에서 메타데이터 열 추출
-                    uploaded.seek(0)
-                    file_magic_meta = uploaded.read(4)
-                    uploaded.seek(0)
-                    
-                    is_zip_based_meta = file_magic_meta[:2] == b'PK'
-                    
-                    if is_zip_based_meta:
-                        # 실제로 XLSX 파일
-                        df_meta = pd.read_excel(uploaded, header=0, engine='openpyxl')
-                    else:
-                        # 실제로 CSV 파일 - 다중 인코딩 시도
-                        df_meta = None
-                        for encoding in ['utf-8-sig', 'cp949', 'euc-kr', 'utf-8', 'latin-1']:
-                            try:
-                                uploaded.seek(0)
-                                df_meta = pd.read_csv(uploaded, encoding=encoding)
-                                break
-                            except Exception:
-                                continue
-                        if df_meta is None:
-                            raise ValueError("CSV 메타데이터를 읽을 수 없습니다.")
-                    
-                    # 회사명 열 찾기
-                    company_col = None
-                    for col in df_meta.columns:
-                        if "회사" in str(col) or "소속" in str(col) or "company" in str(col).lower():
-                            company_col = col
-                            break
+                    # 와이드 파싱 때 함께 추출한 회사명 열 재사용 (파일 재파싱 없음)
+                    company_values = wide_result.get("company_values") or []
                     
-                    # 각 응답자의 회사명 추출 및 정규화
-                    if company_col:
-                        for idx in range(len(df_meta)):
-                            company_raw = df_meta.loc[idx, company_col] if company_col in df_meta.columns else ""
-                            respondent_metadata[idx] = {
-                                "company": normalize_company_name(str(company_raw)) if pd.notna(company_raw) else ""
-                            }
+                    # 각 응답자의 회사명 정규화 (고유 회사명마다 한 번만 정규화 후 매핑)
+                    if company_values:
+                        normalized = {c: normalize_company_name(c) for c in set(company_values) if c}
+                        respondent_metadata = {
+                            idx: {"company": normalized.get(company_raw, "")}
+                            for idx, company_raw in enumerate(company_values)
+                        }
                         with log_box:
-                            st.write(f"✅ 회사명 정규화 완료: {len(respondent_metadata)}개 응답자")
+                            st.write(
+                                f"✅ 회사명 정규화 완료: {len(respondent_metadata)}개 응답자 "
+                                f"(고유 회사명 {len(normalized)}개)"
+                            )
                 except Exception as e:
                     with log_box:
                         st.warning(f"⚠️ 응답자 메타데이터 추출 실패: {str(e)}")
                 
-                op_count = 0
-                for respondent_index, resp_list in sorted(idx_to_resps.items(), key=lambda x: x[0]):
+                # 🆕 응답자 정보 구성 (v2 스키마 - Respondents 시트)
+                respondent_ids: Dict[int, str] = {}
+                respondent_rows: List[Dict] = []
+                respondent_log_lines: List[str] = []
+                # 공통 접두어(upload_{course_id}_)는 한 번만 해시하고 응답자마다 상태를 복사
+                # 💡 재업로드 시 기존 응답자와 같은 ID가 나오도록 원래 형식(md5("upload_{과정}_{번호}")[:10]) 유지
+                base_hasher = hashlib.md5(f"upload_{course_saved_id}_".encode())
+                for respondent_index in respondent_indices:
                     # 🚨 수정: respondentIndex 기반으로 일관된 respondent_id를 생성
                     # 파일 업로드에서 고유한 사용자 해시를 생성하여 respondent_id로 사용
-                    respondent_hash_key = f"upload_{course_saved_id}_{respondent_index}"
-                    respondent_id = f"U-{hashlib.md5(respondent_hash_key.encode()).hexdigest()[:10]}"
+                    h = base_hasher.copy()
+                    h.update(str(respondent_index).encode())
+                    respondent_id = "U-" + h.hexdigest()[:10]
+                    respondent_ids[respondent_index] = respondent_id
                     
-                    # 🆕 응답자 정보 저장 (v2 스키마 - Respondents 시트)
                     respondent_info = respondent_metadata.get(respondent_index, {})
-                    try:
-                        respondent_data = {
-                            "respondent_id": respondent_id,
-                            "course_id": course_saved_id,
-                            "pii_consent": "",
-                            "company": respondent_info.get("company", ""),
-                            "department": "",
-                            "job_role": "",
-                            "tenure_years": "",
-                            "name": "",
-                            "phone": "",
-                            "email": "",
-                            "hashed_contact": "",
-                            "extra_meta": "",
-                            "created_at": datetime.now(timezone.utc).isoformat(),
-                        }
-                        _with_backoff(save_respondent, spreadsheet, respondent_data)
-                        
-                        if respondent_info.get("company"):
-                            with log_box:
-                                st.write(f"   Respondent {respondent_id}: {respondent_info['company']}")
-                    except Exception as e:
-                        with log_box:
-                            st.warning(f"⚠️ 응답자 정보 저장 실패 (ID: {respondent_id}): {str(e)}")
+                    respondent_rows.append({
+                        "respondent_id": respondent_id,
+                        "course_id": course_saved_id,
+                        "pii_consent": "",
+                        "company": respondent_info.get("company", ""),
+                        "department": "",
+                        "job_role": "",
+                        "tenure_years": "",
+                        "name": "",
+                        "phone": "",
+                        "email": "",
+                        "hashed_contact": "",
+                        "extra_meta": "",
+                        "created_at": batch_ts,
+                    })
+                    if respondent_info.get("company"):
+                        respondent_log_lines.append(f"   Respondent {respondent_id}: {respondent_info['company']}")
+                
+                # 응답자 일괄 저장 (기존 응답자는 갱신, 신규는 append_rows 1회)
+                try:
+                    new_respondents = _with_backoff(save_respondents_bulk, spreadsheet, respondent_rows)
+                    with log_box:
+                        st.write(f"✅ 응답자 저장: {len(respondent_rows)}명 (신규 {new_respondents}명)")
+                        if respondent_log_lines:
+                            st.text("\n".join(respondent_log_lines))
+                except Exception as e:
+                    with log_box:
+                        st.warning(f"⚠️ 응답자 정보 일괄 저장 실패: {str(e)}")
+                
+                for respondent_index, original_qid, answer_str, response_value_num in zip(
+                    df_r["respondentIndex"].tolist(),
+                    df_r["questionId"].tolist(),
+                    df_r["answer"].tolist(),
+                    answer_nums,
+                ):
+                    respondent_id = respondent_ids[respondent_index]
+                    # 🚨 v2 스키마로 응답 데이터 구성
+                    # 🔑 핵심: 임시 questionId를 매핑된 실제 item_id로 변환
+                    actual_item_id = question_text_to_item_id.get(original_qid, original_qid)
                     
-                    for r in resp_list:
-                        # 🚨 v2 스키마로 응답 데이터 구성
-                        # 🔑 핵심: 임시 questionId를 매핑된 실제 item_id로 변환
-                        original_qid = r["questionId"]
-                        actual_item_id = question_text_to_item_id.get(original_qid, original_qid)
-                        
-                        answer_str = str(r["answer"]) if r["answer"] else ""
-                        
-                        # 숫자 변환 시도
-                        response_value_num = None
-                        try:
-                            if answer_str.strip():
-                                response_value_num = float(answer_str)
-                        except (ValueError, TypeError):
-                            pass
-                        
-                        response_data = {
-                            "response_id": generate_response_id(),
-                            "course_id": course_saved_id,
-                            "respondent_id": respondent_id,
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "item_id": actual_item_id,  # 🚨 매핑된 실제 item_id 사용
-                            "response_value": answer_str,
-                            "response_value_num": response_value_num,
-                            "choice_value": "",
-                            "comment_text": answer_str if r.get("type") == "subjective" else "",
-                            "source_row_index": str(respondent_index + 2),  # 헤더 제외한 행 번호
-                            "ingest_batch_id": generate_batch_id(),
-                        }
-                        
-                        # 🚨 save_response_v2 호출로 변경
-                        _with_backoff(save_response_v2, spreadsheet, response_data)
-                        imported_responses += 1
-                        op_count += 1
-                        
-                        # More frequent delays to avoid quota limits
-                        if op_count % 20 == 0:
-                            time.sleep(1.5)
-                            with log_box:
-                                st.write(f"⏸️ API 쿼터 보호: 20개 작업마다 1.5초 대기")
-                        
-                        with log_box:
-                            st.write(
-                                f"Responses 등록 (v2): item_id={actual_item_id}, "
-                                f"answer='{answer_str[:60]}', respondent_id={respondent_id}"
-                            )
+                    response_data = {
+                        "response_id": generate_response_id(),
+                        "course_id": course_saved_id,
+                        "respondent_id": respondent_id,
+                        "timestamp": batch_ts,
+                        "item_id": actual_item_id,  # 🚨 매핑된 실제 item_id 사용
+                        "response_value": answer_str,
+                        "response_value_num": response_value_num,
+                        "choice_value": "",
+                        "comment_text": "",  # 와이드 응답에는 문항 유형 정보가 없음
+                        "source_row_index": str(respondent_index + 2),  # 헤더 제외한 행 번호
+                        "ingest_batch_id": batch_id,
+                    }
+                    
+                    # 🚨 버퍼에 모아 RESPONSE_BATCH_SIZE 행 단위로 일괄 저장
+                    pending_responses.append(response_data)
+                    imported_responses += 1
+                    pending_log_lines.append(
+                        f"Responses 등록 (v2): item_id={actual_item_id}, "
+                        f"answer='{answer_str[:60]}', respondent_id={respondent_id}"
+                    )
+                    if len(pending_responses) >= RESPONSE_BATCH_SIZE:
+                        _flush_responses()
+                _flush_responses()
             elif has_responses:
                 r_df = dfs["responses"].fillna("")
-                op_count = 0
-                for row_idx, r in r_df.iterrows():
-                    resp = _normalize_response_row(r.to_dict())
+                resp_rows = [_normalize_response_row(r) for r in r_df.to_dict("records")]
+                # 숫자 응답 값은 한 번에 변환
+                resp_nums = _to_numeric_list([str(resp.get("answer", "")) for resp in resp_rows])
+                for row_idx, (resp, response_value_num) in enumerate(zip(resp_rows, resp_nums)):
                     # courseId 보정
                     if not resp.get("courseId"):
                         resp["courseId"] = course_saved_id
                     
                     # 🚨 v2 스키마로 응답 데이터 구성
                     answer_str = str(resp.get("answer", ""))
-                    
-                    # 숫자 변환 시도
-                    response_value_num = None
-                    try:
-                        if answer_str.strip():
-                            response_value_num = float(answer_str)
-                    except (ValueError, TypeError):
-                        pass
+                    if not answer_str.strip():
+                        continue  # 빈 응답은 저장하지 않음
                     
                     # respondentHash를 respondent_id로 변환
                     respondent_id = f"U-{resp.get('respondentHash', 'unknown')[:10]}"
@@ -2039,32 +2344,26 @@ def page_upload_files(spreadsheet):
                         "response_id": generate_response_id(),
                         "course_id": resp["courseId"],
                         "respondent_id": respondent_id,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": batch_ts,
                         "item_id": resp["questionId"],  # questionId를 item_id로 사용
                         "response_value": answer_str,
                         "response_value_num": response_value_num,
                         "choice_value": "",
                         "comment_text": answer_str,  # 모든 응답을 comment로 저장
                         "source_row_index": str(row_idx + 2),  # 헤더 제외한 행 번호
-                        "ingest_batch_id": generate_batch_id(),
+                        "ingest_batch_id": batch_id,
                     }
                     
-                    # 🚨 save_response_v2 호출로 변경
-                    _with_backoff(save_response_v2, spreadsheet, response_data)
+                    # 🚨 버퍼에 모아 RESPONSE_BATCH_SIZE 행 단위로 일괄 저장
+                    pending_responses.append(response_data)
                     imported_responses += 1
-                    op_count += 1
-                    
-                    # More frequent delays to avoid quota limits
-                    if op_count % 20 == 0:
-                        time.sleep(1.5)
-                        with log_box:
-                            st.write(f"⏸️ API 쿼터 보호: 20개 작업마다 1.5초 대기")
-                    
-                    with log_box:
-                        st.write(
-                            f"Responses 등록 (v2): item_id={resp['questionId']}, "
-                            f"answer='{answer_str[:60]}', respondent_id={respondent_id}"
-                        )
+                    pending_log_lines.append(
+                        f"Responses 등록 (v2): item_id={resp['questionId']}, "
+                        f"answer='{answer_str[:60]}', respondent_id={respondent_id}"
+                    )
+                    if len(pending_responses) >= RESPONSE_BATCH_SIZE:
+                        _flush_responses()
+                _flush_responses()
 
             # 4) 통계 갱신 (v2 스키마에서는 optional - Questions 시트 필요 없음)
             if course_saved_id:
@@ -2101,6 +2400,23 @@ def page_upload_files(spreadsheet):
                 st.code(traceback.format_exc())
 
 
+@st.cache_resource(ttl=600)
+def _detect_schema_version(_spreadsheet) -> str:
+    """스프레드시트 스키마 버전 감지 ("v2" 또는 "v1")
+
+    💡 화면마다 v2 API를 호출해 보고 예외로 레거시를 판별하던 방식을 대체합니다.
+       결과는 캐시되며, 스키마 보증 실행 시 _detect_schema_version.clear()로 갱신합니다.
+    🚨 "v1"은 Courses 시트나 v2 헤더가 실제로 없을 때만 반환합니다.
+       429/5xx 같은 일시 오류는 백오프 후에도 실패하면 그대로 올려 캐시되지 않게 합니다.
+    """
+    try:
+        ws = _call_with_backoff(_spreadsheet.worksheet, "Courses")
+    except WorksheetNotFound:
+        return "v1"
+    headers = _call_with_backoff(ws.row_values, 1)
+    return "v2" if "course_id" in headers else "v1"
+
+
 def page_course_list(spreadsheet, is_admin: bool):
     st.markdown(
         """
@@ -2112,14 +2428,16 @@ def page_course_list(spreadsheet, is_admin: bool):
         unsafe_allow_html=True,
     )
 
-    # v2 스키마 시도
+    # 스키마 버전에 따라 과정 목록 로드
     try:
-        rows = list_courses_v2(spreadsheet, status=None)  # 모든 상태
-        # v2 필드 사용
-        use_v2 = True
-    except Exception:
-        rows = get_all_courses_cached(spreadsheet)
-        use_v2 = False
+        use_v2 = _detect_schema_version(spreadsheet) == "v2"
+        if use_v2:
+            rows = _call_with_backoff(list_courses_v2, spreadsheet, status=None)  # 모든 상태
+        else:
+            rows = get_all_courses_cached(spreadsheet)
+    except Exception as e:
+        st.error(f"❌ 과정 목록 로딩 실패: {str(e)}")
+        return
 
     # 필터링: program_name/title이 있는 것만
     if use_v2:
@@ -2293,6 +2611,7 @@ def _course_editor(spreadsheet, course_id: str):
         new_state = st.toggle("설문 활성화", value=active_now)
         if new_state != active_now:
             set_survey_active(spreadsheet, course_id, new_state)
+            get_all_settings_cached.clear()
             st.toast("설문 활성화 상태가 업데이트되었습니다.")
     with col2:
         st.write("미리보기(간단)")
@@ -2300,14 +2619,17 @@ def _course_editor(spreadsheet, course_id: str):
 
     st.markdown("##### 문항 목록")
 
-    # v2 스키마 시도 (Course_Item_Map + Survey_Items)
+    # 스키마 버전에 따라 문항 로드 (v2: Course_Item_Map + Survey_Items)
     try:
-        questions = get_course_items(spreadsheet, course_id)
-        is_v2 = True
-    except Exception:
-        # 레거시 스키마로 폴백
-        questions = list_questions(spreadsheet, course_id)
-        is_v2 = False
+        is_v2 = _detect_schema_version(spreadsheet) == "v2"
+        if is_v2:
+            questions = get_course_items(spreadsheet, course_id)
+        else:
+            # 레거시 스키마
+            questions = list_questions(spreadsheet, course_id)
+    except Exception as e:
+        st.error(f"❌ 문항 로딩 실패: {str(e)}")
+        return
 
     if not questions:
         st.info("문항이 없습니다. 아래에서 추가하세요.")
@@ -2324,7 +2646,7 @@ def _course_editor(spreadsheet, course_id: str):
                 q_id = q.get('item_id') if is_v2 else q.get('questionId')
                 if st.button("삭제", key=f"del_{q_id}"):
                     if delete_question(spreadsheet, str(q_id)):
-                        st.experimental_rerun()
+                        st.rerun()
 
     st.markdown("##### 문항 추가")
     with st.form("add_question"):
@@ -2365,17 +2687,20 @@ def _course_editor(spreadsheet, course_id: str):
         if submitted:
             upsert_question(spreadsheet, q)
             st.success("문항이 추가되었습니다.")
-            st.experimental_rerun()
+            st.rerun()
 
 
 def _render_preview(spreadsheet, course_id: str):
-    # v2 스키마 시도
+    # 스키마 버전에 따라 문항 로드
     try:
-        questions = get_course_items(spreadsheet, course_id)
-        is_v2 = True
-    except Exception:
-        questions = list_questions(spreadsheet, course_id)
-        is_v2 = False
+        is_v2 = _detect_schema_version(spreadsheet) == "v2"
+        if is_v2:
+            questions = get_course_items(spreadsheet, course_id)
+        else:
+            questions = list_questions(spreadsheet, course_id)
+    except Exception as e:
+        st.caption(f"미리보기 문항 로딩 실패: {str(e)}")
+        return
 
     if not questions:
         st.caption("미리보기할 문항이 없습니다.")
@@ -2435,7 +2760,7 @@ def generate_respondent_hash() -> str:
     """Generate a hash for respondent identification"""
     session_id = st.session_state.get("session_id", "default")
     timestamp = str(datetime.utcnow().timestamp())
-    return hashlib.md5(f"{session_id}_{timestamp}".encode()).hexdigest()[:8]
+    return hashlib.blake2b(f"{session_id}_{timestamp}".encode(), digest_size=4).hexdigest()
 
 
 def mask_ip_address(ip: str) -> str:
@@ -2451,9 +2776,11 @@ def mask_ip_address(ip: str) -> str:
 def render_survey_form(spreadsheet, course_id: str):
     """Render the survey form for a specific course (v2 스키마 호환)"""
 
-    # v2 스키마 시도
+    # 스키마 버전 확인 후 과정 로드 (v2에 없으면 레거시 조회)
     try:
-        course_v2 = get_course_by_id_v2(spreadsheet, course_id)
+        course_v2 = None
+        if _detect_schema_version(spreadsheet) == "v2":
+            course_v2 = get_course_by_id_v2(spreadsheet, course_id)
         if course_v2:
             use_v2 = True
         else:
@@ -2515,13 +2842,16 @@ def render_survey_form(spreadsheet, course_id: str):
         unsafe_allow_html=True,
     )
 
-    # v2 스키마 시도
+    # 스키마 버전에 따라 문항 로드
     try:
-        questions = get_course_items(spreadsheet, course_id)
-        is_v2 = True
-    except Exception:
-        questions = list_questions(spreadsheet, course_id)
-        is_v2 = False
+        is_v2 = _detect_schema_version(spreadsheet) == "v2"
+        if is_v2:
+            questions = get_course_items(spreadsheet, course_id)
+        else:
+            questions = list_questions(spreadsheet, course_id)
+    except Exception as e:
+        st.error(f"❌ 설문 문항 로딩 실패: {str(e)}")
+        return
 
     if not questions:
         st.info("설문 문항이 없습니다.")
@@ -2554,14 +2884,10 @@ def render_survey_form(spreadsheet, course_id: str):
     "<span style='color:#D90B31;font-family: TheJamsil-4;'>*필수 문항*</span>",
      unsafe_allow_html=True)
 
-        # v2 타입 매핑 (likert → rating, single_choice → objective)
+        # v2 타입 매핑 (likert/nps/rating → rating, single_choice/multi_choice/objective → objective)
+        # 🚨 analyze_all과 같은 _question_category로 분류해 폼 위젯과 분석 카테고리를 일치시킴
         if is_v2:
-            if q_type in ['likert', 'nps']:
-                q_type = 'rating'
-            elif q_type in ['single_choice', 'multi_choice']:
-                q_type = 'objective'
-            else:
-                q_type = 'subjective'
+            q_type = _question_category(q, 'subjective')
 
         if q_type == 'objective':
             if is_v2:
@@ -2666,19 +2992,16 @@ def render_survey_form(spreadsheet, course_id: str):
                         }
 
                         with st.spinner("설문을 제출하는 중..."):
-                            save_respondent(spreadsheet, respondent_data)
-
                             # Responses 저장
-                            batch_id = f"B-{
-    datetime.now(
-        timezone.utc).isoformat()}"
-                            for idx, (item_id, answer) in enumerate(
-                                responses.items()):
-                                response_data = {
-                                    "response_id": f"R-{uuid.uuid4().hex[:12]}",
+                            # 💡 한 번의 제출은 같은 시각/배치로 기록 (response_id만 행마다 전체 uuid4로 생성해 충돌 방지)
+                            submit_ts = datetime.now(timezone.utc).isoformat()
+                            batch_id = f"B-{submit_ts}"
+                            response_rows = [
+                                {
+                                    "response_id": f"R-{uuid.uuid4().hex}",
                                     "course_id": course_id,
                                     "respondent_id": respondent_id,
-                                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                                    "timestamp": submit_ts,
                                     "item_id": item_id,
                                     "response_value": answer,
                                     "choice_value": None,
@@ -2687,11 +3010,11 @@ def render_survey_form(spreadsheet, course_id: str):
                                     "source_row_index": None,
                                     "ingest_batch_id": batch_id,
                                 }
-                                save_response_v2(spreadsheet, response_data)
-
-                                # Add small delay to avoid quota limits
-                                if idx > 0 and idx % 5 == 0:
-                                    time.sleep(0.5)
+                                for item_id, answer in responses.items()
+                            ]
+                            # 응답자 1행 + 응답 N행을 spreadsheets.batchUpdate 1회로 저장 (행별 API 호출/대기 제거)
+                            _call_with_backoff(save_submission_v2, spreadsheet, respondent_data, response_rows,
+                                               idempotent=False)
                     else:
                         # 레거시 스키마
                         respondent_hash = generate_respondent_hash()
@@ -2699,14 +3022,13 @@ def render_survey_form(spreadsheet, course_id: str):
                         ip_masked = mask_ip_address("unknown")
 
                         with st.spinner("설문을 제출하는 중..."):
-                            for idx, (q_id, answer) in enumerate(
-                                responses.items()):
-                                save_response(
-                                    spreadsheet, course_id, q_id, answer,
-                                    respondent_hash, session_id, ip_masked
-                                )
-                                if idx > 0 and idx % 5 == 0:
-                                    time.sleep(0.5)
+                            # 모든 응답을 append_rows 1회로 저장 (행별 API 호출/대기 제거)
+                            _call_with_backoff(
+                                save_responses_bulk,
+                                spreadsheet, course_id, responses,
+                                respondent_hash, session_id, ip_masked,
+                                idempotent=False,
+                            )
 
                         # Update stats
                         update_response_stats(spreadsheet, course_id)
@@ -2719,8 +3041,8 @@ def render_survey_form(spreadsheet, course_id: str):
                         if f"q_{q_id}" in st.session_state:
                             del st.session_state[f"q_{q_id}"]
 
-                    # Clear cache
-                    st.cache_data.clear()
+                    # Clear cache (이 과정의 응답 캐시만 무효화 - 과정/문항 캐시는 유지)
+                    _invalidate_response_caches(spreadsheet, course_id)
 
                 except Exception as e:
                     st.error(f"❌ 설문 제출 중 오류가 발생했습니다: {str(e)}")
@@ -2736,8 +3058,15 @@ def page_survey_participation(spreadsheet):
     use_v2 = False
     
     # v2 스키마 시도
+    # 💡 batch_load_dashboard는 과정 1개 기준으로 4개 시트를 함께 읽으므로 여기에는 맞지 않습니다.
+    #    이 화면은 Courses 시트 하나의 전체 목록만 필요하므로, 대신 수정 시각 기준 캐시로
+    #    선택 변경 등 재실행마다 Courses 전체를 다시 읽지 않게 합니다.
     try:
-        courses_v2 = list_courses_v2(spreadsheet)
+        courses_v2 = _records_if_changed(
+            spreadsheet,
+            cache_key=("courses_v2",),
+            fetch=lambda: list_courses_v2(spreadsheet),
+        )
         use_v2 = bool(courses_v2)
     except Exception:
         use_v2 = False
@@ -2753,9 +3082,10 @@ def page_survey_participation(spreadsheet):
     else:
         # 레거시 스키마 - course_rows로 받기 (courses 금지!)
         course_rows = get_all_courses_cached(spreadsheet)
+        # 💡 과정마다 SurveySettings를 조회하지 않고, 한 번 읽은 courseId → 설정 dict로 조인
+        settings_map = get_all_settings_cached(spreadsheet)
         for course in course_rows:
-            settings = get_survey_settings(
-                spreadsheet, str(course.get('courseId')))
+            settings = settings_map.get(str(course.get('courseId')), {})
             if str(settings.get('isActive', 'FALSE')).upper() == 'TRUE':
                 active_courses.append(course)
 
@@ -2806,127 +3136,150 @@ def configure_gemini():
         return None
 
 
+def _bind_answer_extractor(sample: Dict, primary_key: str, secondary_key: str = None):
+    """첫 응답 행으로 스키마(v2/레거시)를 한 번만 판별해 응답값 추출 함수를 반환
+
+    💡 행마다 v2/레거시 키를 번갈아 조회하지 않도록, 문항별로 고정된 추출기를 바인딩합니다.
+    """
+    if primary_key in sample:
+        if secondary_key is None:
+            return lambda r: r.get(primary_key)
+        return lambda r: r.get(primary_key) or r.get(secondary_key)
+    return lambda r: r.get("answer", "")
+
+
+def _answers_frame(responses_by_qid: Dict[str, List[Dict]], primary_key: str, secondary_key: str = None) -> pd.DataFrame:
+    """문항별 응답 목록을 (item, value) 두 열짜리 DataFrame 하나로 펼침 (문항마다 추출기를 한 번 바인딩)"""
+    item_ids = []
+    raw_answers = []
+    for q_id, responses in responses_by_qid.items():
+        if not responses:
+            continue
+        extract = _bind_answer_extractor(responses[0], primary_key, secondary_key)
+        raw_answers.extend(map(extract, responses))
+        item_ids.extend([q_id] * len(responses))
+    return pd.DataFrame({"item": item_ids, "value": pd.Series(raw_answers, dtype=object)})
+
+
+def _aggregate_ratings(responses_by_qid: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+    """여러 평점형 문항의 분포/평균을 pandas groupby 한 번으로 집계"""
+    df = _answers_frame(responses_by_qid, "response_value_num")
+
+    # 숫자 변환 불가 응답은 NaN으로 무시, float → int (소수점 이하 버림)
+    nums = pd.to_numeric(df["value"].astype(str).str.strip(), errors="coerce")
+    df = df.assign(value=nums)[np.isfinite(nums.to_numpy(dtype=np.float64))]
+    df["value"] = df["value"].astype(np.int64)
+
+    # (문항, 평점)별 응답 수 한 번만 집계 → 응답 수/평균도 이 분포에서 계산
+    counts_by_item = {}
+    for (q_id, rating), count in df.groupby(["item", "value"]).size().items():
+        counts_by_item.setdefault(q_id, {})[int(rating)] = int(count)
+
+    results = {}
+    for q_id, responses in responses_by_qid.items():
+        if not responses:
+            results[q_id] = {"no_data": True}
+        elif q_id in counts_by_item:
+            counts = counts_by_item[q_id]
+            total = sum(counts.values())
+            results[q_id] = {
+                "no_data": False,
+                "counts": counts,
+                "total": total,  # 응답 수: 유효한 rating만 카운트
+                "average": sum(rating * count for rating, count in counts.items()) / total,
+            }
+        else:
+            results[q_id] = {"no_data": False, "counts": {}, "total": 0, "average": 0}
+    return results
+
+
+def _aggregate_choices(responses_by_qid: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+    """여러 객관식 문항의 선택지 분포를 pandas groupby 한 번으로 집계 (선택지는 처음 등장한 순서 유지)"""
+    df = _answers_frame(responses_by_qid, "response_value", "choice_value")
+    texts = df["value"].where(df["value"].notna(), "").astype(str).str.strip()
+    df = df.assign(value=texts)[texts != ""]
+
+    counts_by_item = {}
+    for (q_id, choice), count in df.groupby(["item", "value"], sort=False).size().items():
+        counts_by_item.setdefault(q_id, {})[choice] = int(count)
+
+    results = {}
+    for q_id, responses in responses_by_qid.items():
+        if not responses:
+            results[q_id] = {"no_data": True}
+        else:
+            results[q_id] = {
+                "no_data": False,
+                "counts": counts_by_item.get(q_id, {}),
+                "total": len(responses)
+            }
+    return results
+
+
 def analyze_rating_data(
-    spreadsheet,
-    course_id: str,
     question: Dict,
-    all_responses: List[Dict] = None) -> Dict:
-    """Analyze rating-type question responses (v2 호환 로직)"""
-    # ⚠️ 레거시 get_responses_by_question 호출은 생략 (all_responses 사용 권장)
+    question_responses: List[Dict] = None) -> Dict:
+    """Analyze rating-type question responses (v2 호환 로직)
 
-    # v2 스키마에서 item_id를 사용하고, 없으면 레거시 questionId를 사용
-    q_id = str(question.get('item_id') or question.get('questionId'))
-    
-    if all_responses is None:
-        return {"no_data": True, "error": "All responses not provided."}
+    question_responses: page_dashboard에서 item_id 기준으로 미리 그룹화한 해당 문항의 응답 목록
+    """
+    # ⚠️ 레거시 get_responses_by_question 호출은 생략 (미리 그룹화된 응답 사용)
+    if question_responses is None:
+        return {"no_data": True, "error": "Question responses not provided."}
 
-    # 캐시된 응답에서 해당 문항만 필터링 (v2는 item_id 사용)
-    responses = [r for r in all_responses if str(r.get("item_id") or r.get("questionId")) == q_id]
+    responses = question_responses
 
     if not responses:
         return {"no_data": True}
 
-    # Count ratings (safely convert to int)
-    rating_counts = Counter()
-    valid_ratings = []
-    for r in responses:
-        try:
-            # v2 스키마는 response_value_num 사용 (숫자 응답)
-            answer_v2_key = r.get("response_value_num")
-            
-            # v2 키를 우선 사용하고, 없으면 레거시 answer 키를 폴백
-            answer = answer_v2_key if answer_v2_key is not None else r.get("answer", "")
-            
-            if answer is not None and str(answer).strip():
-                rating = int(float(str(answer).strip())) # 안전하게 float 변환 후 int
-                rating_counts[rating] += 1
-                valid_ratings.append(rating)
-        except (ValueError, TypeError):
-            # 숫자로 변환할 수 없는 응답은 무시
-            pass
-
-    average = sum(valid_ratings) / len(valid_ratings) if valid_ratings else 0
-
-    return {
-        "no_data": False,
-        "counts": dict(rating_counts),
-        "total": len(valid_ratings), # 응답 수: 유효한 rating만 카운트
-        "average": average
-    }
+    # v2 스키마는 response_value_num 사용 (숫자 응답), 없으면 레거시 answer 키를 폴백
+    return _aggregate_ratings({"_": responses})["_"]
 
 
 def analyze_objective_data(
-    spreadsheet,
-    course_id: str,
     question: Dict,
-    all_responses: List[Dict] = None) -> Dict:
-    """Analyze objective-type question responses (v2 호환 로직)"""
-    # ⚠️ 레거시 get_responses_by_question 호출은 생략
-
-    # v2 스키마에서 item_id를 사용하고, 없으면 레거시 questionId를 사용
-    q_id = str(question.get('item_id') or question.get('questionId'))
+    question_responses: List[Dict] = None) -> Dict:
+    """Analyze objective-type question responses (v2 호환 로직)
 
-    if all_responses is None:
-        return {"no_data": True, "error": "All responses not provided."}
+    question_responses: page_dashboard에서 item_id 기준으로 미리 그룹화한 해당 문항의 응답 목록
+    """
+    # ⚠️ 레거시 get_responses_by_question 호출은 생략
+    if question_responses is None:
+        return {"no_data": True, "error": "Question responses not provided."}
 
-    # 캐시된 응답에서 해당 문항만 필터링
-    responses = [r for r in all_responses if str(r.get("item_id") or r.get("questionId")) == q_id]
+    responses = question_responses
 
     if not responses:
         return {"no_data": True}
 
     # Count choices (convert to string first)
-    choice_counts = Counter()
-    for r in responses:
-        # v2 스키마는 response_value 또는 choice_value 사용 (선택지 텍스트)
-        answer_v2_key = r.get("response_value") or r.get("choice_value")
-        
-        # v2 키를 우선 사용하고, 없으면 레거시 answer 키를 폴백
-        answer = answer_v2_key if answer_v2_key is not None else r.get("answer", "")
-        
-        if answer is not None:
-            answer_str = str(answer).strip()
-            if answer_str:
-                # multi_choice인 경우 쉼표로 분리하여 각 선택지를 카운트할 수 있지만, 
-                # 여기서는 단일 문자열로 카운트하는 레거시 방식을 유지합니다.
-                choice_counts[answer_str] += 1
-
-    return {
-        "no_data": False,
-        "counts": dict(choice_counts),
-        "total": len(responses)
-    }
+    # v2 스키마는 response_value 또는 choice_value 사용 (선택지 텍스트), 없으면 레거시 answer 키를 폴백
+    # multi_choice인 경우 쉼표로 분리하여 각 선택지를 카운트할 수 있지만,
+    # 여기서는 단일 문자열로 카운트하는 레거시 방식을 유지합니다.
+    return _aggregate_choices({"_": responses})["_"]
 
 
 def analyze_subjective_data(
-    spreadsheet,
-    course_id: str,
     question: Dict,
-    all_responses: List[Dict] = None) -> Dict:
-    """Analyze subjective-type question responses (v2 호환 로직)"""
-    # ⚠️ 레거시 get_responses_by_question 호출은 생략
-    
-    # v2 스키마에서 item_id를 사용하고, 없으면 레거시 questionId를 사용
-    q_id = str(question.get('item_id') or question.get('questionId'))
+    question_responses: List[Dict] = None) -> Dict:
+    """Analyze subjective-type question responses (v2 호환 로직)
 
-    if all_responses is None:
-        return {"no_data": True, "error": "All responses not provided."}
+    question_responses: page_dashboard에서 item_id 기준으로 미리 그룹화한 해당 문항의 응답 목록
+    """
+    # ⚠️ 레거시 get_responses_by_question 호출은 생략
+    if question_responses is None:
+        return {"no_data": True, "error": "Question responses not provided."}
 
-    # 캐시된 응답에서 해당 문항만 필터링
-    responses = [r for r in all_responses if str(r.get("item_id") or r.get("questionId")) == q_id]
+    responses = question_responses
 
     if not responses:
         return {"no_data": True}
 
     # Collect text responses (convert to string first)
+    # v2 스키마는 response_value 또는 comment_text 사용 (주관식 텍스트), 없으면 레거시 answer 키를 폴백
+    extract = _bind_answer_extractor(responses[0], "response_value", "comment_text")
     texts = []
-    for r in responses:
-        # v2 스키마는 response_value 또는 comment_text 사용 (주관식 텍스트)
-        answer_v2_key = r.get("response_value") or r.get("comment_text")
-        
-        # v2 키를 우선 사용하고, 없으면 레거시 answer 키를 폴백
-        answer = answer_v2_key if answer_v2_key is not None else r.get("answer", "")
-        
+    for answer in map(extract, responses):
         if answer is not None:
             answer_str = str(answer).strip()
             if answer_str:
@@ -2939,11 +3292,75 @@ def analyze_subjective_data(
     }
 
 
-def generate_wordcloud(texts: List[str]) -> plt.Figure:
-    """Generate wordcloud from text list"""
+def analyze_all(
+    questions: List[Dict],
+    responses_by_item: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+    """문항 목록을 한 번만 순회하며 유형별 분석 결과를 함께 계산
+
+    응답이 없는 문항은 결과에 포함하지 않습니다 (대시보드에서 '0건'으로 표시).
+
+    Returns:
+        {"objective": {q_id: 결과}, "rating": {q_id: 결과}, "subjective": {q_id: 결과},
+         "subjective_count": {q_id: 주관식 응답 수}}
+    """
+    rating_items = {}
+    objective_items = {}
+    subjective = {}
+    subjective_count = {}
+    for q in questions:
+        # page_dashboard에서 미리 계산해 둔 _id/_category를 우선 사용
+        q_id = q.get('_id') or str(q.get('item_id') or q.get('questionId'))
+        related_responses = responses_by_item.get(q_id)
+        if not related_responses:
+            continue
+
+        category = q.get('_category') or _question_category(q)
+        if category == 'rating':
+            rating_items[q_id] = related_responses
+        elif category == 'objective':
+            objective_items[q_id] = related_responses
+        elif category == 'subjective':
+            subjective[q_id] = analyze_subjective_data(q, related_responses)
+            subjective_count[q_id] = subjective[q_id].get('total', 0)
+
+    # 💡 평점/객관식은 문항별로 따로 세지 않고 유형별 groupby 한 번으로 집계
+    return {
+        'objective': _aggregate_choices(objective_items),
+        'rating': _aggregate_ratings(rating_items),
+        'subjective': subjective,
+        'subjective_count': subjective_count  # 저장용 문항별 주관식 응답 수
+    }
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def analyze_all_cached(
+    course_id: str,
+    question_ids: Tuple[str, ...],
+    response_total: int,
+    _questions: List[Dict],
+    _responses_by_item: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+    """analyze_all 결과 캐시 (과정 ID + 분석 대상 문항 ID + 응답 수를 키로 사용)
+
+    💡 문항/응답 목록 자체는 해시하지 않으므로(_ 접두사), 응답 로더 캐시와 같은 TTL을 둡니다.
+    """
+    return analyze_all(_questions, _responses_by_item)
+
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def generate_wordcloud(texts: Tuple[str, ...]) -> Optional[bytes]:
+    """Generate wordcloud PNG bytes from text tuple
+
+    💡 같은 응답 묶음이면 캐시된 PNG를 그대로 반환합니다 (matplotlib Figure 대신 PIL 이미지로 직접 저장).
+    """
     if not texts:
         return None
 
+    # 워드클라우드가 필요한 주관식 탭에서만 로드 (앱 시작 시 import 비용 제거)
+    try:
+        from wordcloud import WordCloud
+    except ImportError:
+        return None
+
     combined_text = " ".join(texts)
 
     # Create wordcloud
@@ -2957,10 +3374,65 @@ def generate_wordcloud(texts: List[str]) -> plt.Figure:
         min_font_size=10
     ).generate(combined_text)
 
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.imshow(wc, interpolation='bilinear')
-    ax.axis('off')
-    return fig
+    buf = io.BytesIO()
+    wc.to_image().save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class _BoundedCache:
+    """프로세스 전역 캐시용 스레드 안전 LRU (선택적으로 항목별 TTL)
+
+    💡 Streamlit 세션은 스레드별로 실행되므로 잠금으로 보호하고, 저장 시 만료 항목을 정리한 뒤
+       max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, max_entries: int, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: "OrderedDict[object, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl is not None and now - stored_at >= self.ttl
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if self._expired(entry[0], time.time()):
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value) -> None:
+        now = time.time()
+        with self._lock:
+            if self.ttl is not None:
+                for k in [k for k, (ts, _) in self._data.items() if self._expired(ts, now)]:
+                    del self._data[k]
+            self._data[key] = (now, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+
+# 동일한 분석 요약에 대한 Gemini 결과 캐시: {프롬프트 해시: 결과 텍스트}
+# 💡 스트리밍 출력과 함께 써야 해서 st.cache_data 대신 직접 보관합니다.
+AI_INSIGHTS_TTL = 1800  # 초
+_AI_INSIGHTS_CACHE = _BoundedCache(max_entries=64, ttl=AI_INSIGHTS_TTL)
+
+
+def _stream_gemini_text(client, prompt: str):
+    """Gemini 스트리밍 응답에서 텍스트 조각만 순서대로 내보냄"""
+    stream = client.models.generate_content_stream(
+        model="gemini-2.0-flash-exp",
+        contents=prompt
+    )
+    for chunk in stream:
+        if chunk.text:
+            yield chunk.text
 
 
 def generate_ai_insights(
@@ -2968,10 +3440,16 @@ def generate_ai_insights(
     course_id: str,
     questions: List[Dict],
     all_analysis: Dict) -> str:
-    """Generate AI insights using Gemini (v2 호환 로직)"""
+    """Generate AI insights using Gemini (v2 호환 로직)
+
+    결과는 생성되는 대로 화면에 스트리밍 출력하고, 전체 텍스트를 반환합니다.
+    같은 분석 요약이면 TTL 동안 캐시된 결과를 바로 출력합니다.
+    """
     client = configure_gemini()
     if not client:
-        return "Gemini AI를 사용할 수 없습니다. API 키를 설정해주세요."
+        message = "Gemini AI를 사용할 수 없습니다. API 키를 설정해주세요."
+        st.markdown(message)
+        return message
 
     try:
         # Prepare summary for Gemini
@@ -2987,24 +3465,24 @@ def generate_ai_insights(
             summary += f"유형: {q_type}\n"
 
             # 통합 분류: v2와 레거시 타입을 모두 지원
+            category = _QTYPE_MAP.get(q_type)
+            data = all_analysis.get(category, {}).get(q_id) if category else None
+
             # likert, nps, rating → rating 카테고리
-            if q_type in ['likert', 'nps', 'rating'] and q_id in all_analysis.get('rating', {}):
-                data = all_analysis['rating'][q_id]
+            if category == 'rating' and data is not None:
                 if not data.get('no_data'):
                     summary += f"평균 점수: {data.get('average', 0):.2f}\n"
                     summary += f"응답 수: {data.get('total', 0)}\n"
                     summary += f"점수 분포: {data.get('counts', {})}\n"
 
             # single_choice, multi_choice, objective → objective 카테고리
-            elif q_type in ['single_choice', 'multi_choice', 'objective'] and q_id in all_analysis.get('objective', {}):
-                data = all_analysis['objective'][q_id]
+            elif category == 'objective' and data is not None:
                 if not data.get('no_data'):
                     summary += f"선택 분포: {data.get('counts', {})}\n"
                     summary += f"응답 수: {data.get('total', 0)}\n"
 
             # text, subjective → subjective 카테고리
-            elif q_type in ['text', 'subjective'] and q_id in all_analysis.get('subjective', {}):
-                data = all_analysis['subjective'][q_id]
+            elif category == 'subjective' and data is not None:
                 if not data.get('no_data'):
                     summary += f"주관식 응답 수: {data.get('total', 0)}\n"
                     sample = data.get('responses', [])[:3]
@@ -3028,59 +3506,108 @@ def generate_ai_insights(
 한국어로 명확하고 구체적으로 작성해주세요.
         """
 
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-exp",
-            contents=prompt
-        )
+        prompt_key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+        cached = _AI_INSIGHTS_CACHE.get(prompt_key)
+        if cached is not None:
+            st.markdown(cached)
+            return cached
 
-        return response.text
+        # 💡 첫 조각부터 바로 화면에 출력 (전체 응답을 기다리지 않음, st.write_stream은 Streamlit 1.31+)
+        insights = st.write_stream(_stream_gemini_text(client, prompt))
+        if isinstance(insights, list):
+            insights = "".join(str(part) for part in insights)
+        if insights:
+            _AI_INSIGHTS_CACHE.set(prompt_key, insights)
+        return insights
 
     except Exception as e:
-        return f"AI 분석 중 오류가 발생했습니다: {str(e)}"
+        message = f"AI 분석 중 오류가 발생했습니다: {str(e)}"
+        st.markdown(message)
+        return message
+
+
+# 스프레드시트 수정 시각(modifiedTime) 기준 레코드 캐시: {(spreadsheet_id, key): (revision, records)}
+# 💡 과정별 항목이 계속 쌓이지 않도록 최근 사용 순(LRU)으로 최대 항목 수를 제한합니다.
+_SHEET_RECORDS_CACHE = _BoundedCache(max_entries=32)
+
+
+def _sheet_revision(spreadsheet):
+    """Drive API로 스프레드시트의 마지막 수정 시각을 조회 (실패 시 None)
+
+    💡 gspread 6.x는 get_lastUpdateTime(), 5.x는 lastUpdateTime 속성으로 조회합니다.
+    """
+    try:
+        getter = getattr(spreadsheet, "get_lastUpdateTime", None)
+        return getter() if getter is not None else spreadsheet.lastUpdateTime
+    except Exception:
+        return None
+
+
+def _records_if_changed(spreadsheet, ws=None, cache_key=None, fetch=None):
+    """스프레드시트가 마지막 조회 이후 변경되지 않았다면 보관해 둔 레코드를 반환
+
+    💡 cache_data TTL이 만료되어도 수정 시각 조회(가벼운 Drive API 1회)만으로
+       변경 여부를 확인하고, 변경된 경우에만 get_all_records()를 다시 호출합니다.
+    """
+    if cache_key is None:
+        cache_key = ("records", ws.title)
+    if fetch is None:
+        fetch = ws.get_all_records
+    full_key = (spreadsheet.id,) + tuple(cache_key)
+
+    revision = _sheet_revision(spreadsheet)
+    entry = _SHEET_RECORDS_CACHE.get(full_key)
+    if revision is not None and entry is not None and entry[0] == revision:
+        return entry[1]
+
+    records = _call_with_backoff(fetch)
+    if revision is not None:
+        _SHEET_RECORDS_CACHE.set(full_key, (revision, records))
+    return records
+
+
+def _response_item_key(resp: Dict) -> str:
+    """응답의 문항 키 (v2 item_id, 레거시 questionId)를 문자열로 정규화 (없으면 빈 문자열)"""
+    return str(resp.get("item_id") or resp.get("questionId") or "")
+
+
+def _index_by_course(all_responses: List[Dict]) -> Dict[str, List[Dict]]:
+    """응답 레코드를 course_id(레거시: courseId) 문자열 기준으로 묶음
+
+    문항별 그룹화에 쓰는 정규화 키(_key)도 이때 한 번 계산해 둡니다.
+    """
+    by_course = defaultdict(list)
+    for r in all_responses:
+        r["_key"] = _response_item_key(r)
+        by_course[str(r.get("course_id") or r.get("courseId"))].append(r)
+    return dict(by_course)
 
 
 @st.cache_data(ttl=120)  # Cache for 2 minutes
 def get_all_responses_cached(_spreadsheet, course_id: str):
     """
-    [핵심 수정] 응답 시트 이름을 유연하게 찾아 v2 데이터를 로드하고, 디버깅 정보를 출력합니다.
+    [핵심 수정] 응답 시트 이름을 유연하게 찾아 v2 데이터를 로드합니다.
+    🚨 캐시된 함수 안의 st 요소는 모든 사용자에게 재생되므로 디버그 출력은 여기서 하지 않습니다.
+       (page_dashboard에서 get_response_load_stats로 세션별 표시)
     """
-    target_sheet_name = None
-    
     try:
-        # 1. 시트 검색 (유연하게)
-        worksheets = _spreadsheet.worksheets()
-        for ws in worksheets:
-            if "responses" in ws.title.lower() or "response" in ws.title.lower():
-                target_sheet_name = ws.title
-                break
+        # 1. 시트 검색 (유연하게 - 메모이즈된 시트 맵 사용)
+        ws = _call_with_backoff(find_worksheet, _spreadsheet, "responses", "response")
         
-        if not target_sheet_name:
+        if ws is None:
             st.warning("🔍 Responses 시트를 찾을 수 없습니다. 시트 이름을 확인하세요.")
             return []
 
-        # 2. 데이터 로드 (API 호출 지점)
-        ws = _spreadsheet.worksheet(target_sheet_name)
-        all_responses = ws.get_all_records()  # <-- 헤더를 기반으로 dict 리스트 로드
-        
-        # 3. course_id로 필터링
-        filtered_responses = [
-            r for r in all_responses 
-            if str(r.get("course_id") or r.get("courseId")) == str(course_id)
-        ]
-        
-        # 4. 🔑 최종 디버그 로직 추가: 로딩 상태를 명확히 표시
-        st.caption(f"**🔍 로딩 디버그 (시트: {target_sheet_name})**")
-        st.write(f"- 전체 응답 레코드 수: {len(all_responses)}")
-        st.write(f"- 필터링 course_id: **{course_id}**")
-        st.write(f"- 최종 필터링 후 응답 수: **{len(filtered_responses)}**개")
-        
-        if len(all_responses) > 0 and len(filtered_responses) == 0:
-            st.error("🚨 필터링 실패! 시트에 course_id가 불일치할 수 있습니다.")
-            # 실제 시트에 존재하는 course_id들을 보여줍니다.
-            sheet_course_ids = set(str(r.get('course_id') or r.get('courseId')) for r in all_responses if r.get('course_id') or r.get('courseId'))
-            st.code(f"시트 내 course_id 목록: {sheet_course_ids}")
+        # 2. 데이터 로드 + course_id별 인덱스 (스프레드시트가 변경된 경우에만 API 호출/재색인)
+        #    💡 과정마다 전체 응답을 다시 훑지 않도록 course_id → 응답 목록 dict를 함께 보관
+        responses_by_course = _records_if_changed(
+            _spreadsheet,
+            cache_key=("responses_by_course", ws.title),
+            fetch=lambda: _index_by_course(ws.get_all_records()),
+        )
         
-        return filtered_responses
+        # 3. course_id로 필터링 (dict 조회)
+        return responses_by_course.get(str(course_id), [])
     
     except Exception as e:
         # API 오류가 아닌 다른 예외 처리
@@ -3088,6 +3615,93 @@ def get_all_responses_cached(_spreadsheet, course_id: str):
         return []
 
 
+def get_response_load_stats(spreadsheet) -> Optional[Dict]:
+    """응답 로딩 디버그용 집계 (시트 이름, 전체 응답 수, course_id별 응답 수)
+
+    💡 get_all_responses_cached와 같은 리비전 캐시 항목을 재사용하므로 추가 전체 조회가 없습니다.
+    """
+    ws = _call_with_backoff(find_worksheet, spreadsheet, "responses", "response")
+    if ws is None:
+        return None
+    responses_by_course = _records_if_changed(
+        spreadsheet,
+        cache_key=("responses_by_course", ws.title),
+        fetch=lambda: _index_by_course(ws.get_all_records()),
+    )
+    return {
+        "sheet": ws.title,
+        "total": sum(len(rows) for rows in responses_by_course.values()),
+        "counts": {cid: len(rows) for cid, rows in responses_by_course.items()},
+    }
+
+
+def _render_loader_debug(spreadsheet, course_id: str, filtered_count: int) -> None:
+    """DB 설정의 '응답 로딩 디버그' 옵션(debug_loader)이 켜진 세션에만 로딩 진단 표시"""
+    if not st.session_state.get("debug_loader"):
+        return
+    try:
+        stats = get_response_load_stats(spreadsheet)
+    except Exception as e:
+        st.caption(f"🔍 로딩 디버그 정보를 가져오지 못했습니다: {str(e)}")
+        return
+    if stats is None:
+        return
+    st.caption(f"**🔍 로딩 디버그 (시트: {stats['sheet']})**")
+    st.write(f"- 전체 응답 레코드 수: {stats['total']}")
+    st.write(f"- 필터링 course_id: **{course_id}**")
+    st.write(f"- 최종 필터링 후 응답 수: **{filtered_count}**개")
+
+    if stats["total"] > 0 and filtered_count == 0:
+        st.error("🚨 필터링 실패! 시트에 course_id가 불일치할 수 있습니다.")
+        # 실제 시트에 존재하는 course_id들을 보여줍니다.
+        sheet_course_ids = set(stats["counts"]) - {"None", ""}
+        st.code(f"시트 내 course_id 목록: {sheet_course_ids}")
+
+
+@st.cache_data(ttl=120)  # Cache for 2 minutes
+def get_responses_grouped_cached(_spreadsheet, course_id: str) -> Dict:
+    """
+    과정 응답을 item_id(레거시: questionId) 기준으로 그룹화해 캐시합니다.
+
+    Returns:
+        {"by_item": {item_id: [응답, ...]}, "total": 응답 수, "unique_respondents": 고유 응답자 수}
+    """
+    return _group_responses(get_all_responses_cached(_spreadsheet, course_id))
+
+
+def _group_responses(all_responses: List[Dict]) -> Dict:
+    """응답 목록을 item_id(레거시: questionId) 기준으로 묶고 응답자 수를 집계"""
+    by_item = defaultdict(list)
+    respondent_hashes = set()
+    for resp in all_responses:
+        # 로딩 단계에서 정규화된 _key를 우선 사용 (없으면 한 번 계산해 저장)
+        resp_key = resp.get("_key")
+        if resp_key is None:
+            resp_key = resp["_key"] = _response_item_key(resp)
+        if resp_key:
+            by_item[resp_key].append(resp)
+        # 안전하게 respondentHash 추출 (v2와 레거시 호환)
+        hash_val = resp.get("respondentHash") or resp.get("respondent_id")
+        if hash_val:
+            respondent_hashes.add(str(hash_val))
+
+    return {
+        "by_item": dict(by_item),
+        "total": len(all_responses),
+        "unique_respondents": len(respondent_hashes),
+    }
+
+
+def _invalidate_response_caches(spreadsheet, course_id: str) -> None:
+    """설문 제출 후 해당 과정의 응답 관련 캐시 항목만 삭제"""
+    for cached_fn in (get_all_responses_cached, get_responses_grouped_cached, get_dashboard_data_cached):
+        try:
+            cached_fn.clear(spreadsheet, course_id)
+        except TypeError:
+            # 인자별 삭제를 지원하지 않는 Streamlit 버전은 함수 단위로 삭제
+            cached_fn.clear()
+
+
 @st.cache_data(ttl=120)  # Cache for 2 minutes
 def get_all_questions_cached(_spreadsheet, course_id: str):
     """
@@ -3096,18 +3710,14 @@ def get_all_questions_cached(_spreadsheet, course_id: str):
     target_sheet_name = None
     
     try:
-        worksheets = _spreadsheet.worksheets()
         # 'questions' 또는 'question' 키워드가 포함된 시트를 찾습니다.
-        for ws in worksheets:
-            if "questions" in ws.title.lower() or "question" in ws.title.lower():
-                target_sheet_name = ws.title
-                break
+        ws = _call_with_backoff(find_worksheet, _spreadsheet, "questions", "question")
         
-        if not target_sheet_name:
+        if ws is None:
             raise ValueError("스프레드시트에서 'Questions' 시트를 찾을 수 없습니다.")
+        target_sheet_name = ws.title
 
-        ws = _spreadsheet.worksheet(target_sheet_name)
-        records = ws.get_all_records()
+        records = _records_if_changed(_spreadsheet, ws)
         filtered = [
             r for r in records if str(
                 r.get("courseId")) == str(course_id)]
@@ -3134,18 +3744,14 @@ def get_all_courses_cached(_spreadsheet):
     target_sheet_name = None
     
     try:
-        worksheets = _spreadsheet.worksheets()
         # 'courses' 또는 'course' 키워드가 포함된 시트를 찾습니다.
-        for ws in worksheets:
-            if "courses" in ws.title.lower() or "course" in ws.title.lower():
-                target_sheet_name = ws.title
-                break
+        ws = _call_with_backoff(find_worksheet, _spreadsheet, "courses", "course")
         
-        if not target_sheet_name:
+        if ws is None:
             raise ValueError("스프레드시트에서 'Courses' 시트를 찾을 수 없습니다.")
+        target_sheet_name = ws.title
 
-        ws = _spreadsheet.worksheet(target_sheet_name)
-        return ws.get_all_records()
+        return _records_if_changed(_spreadsheet, ws)
     except Exception as e:
         st.error(f"과정 데이터 로드 실패: {str(e)}")
         if target_sheet_name:
@@ -3155,6 +3761,27 @@ def get_all_courses_cached(_spreadsheet):
         return []
 
 
+@st.cache_data(ttl=180)  # Cache for 3 minutes
+def get_all_settings_cached(_spreadsheet) -> Dict[str, Dict]:
+    """
+    SurveySettings 시트를 한 번 읽어 courseId → 설정 행 dict로 반환합니다.
+    (과정별 get_survey_settings 반복 호출 대신 사용)
+    """
+    try:
+        ws = _call_with_backoff(find_worksheet, _spreadsheet, "surveysettings")
+        if ws is None:
+            return {}
+        records = _records_if_changed(_spreadsheet, ws)
+        # 중복 courseId는 첫 번째 행을 사용 (get_survey_settings/set_survey_active와 동일)
+        settings_map: Dict[str, Dict] = {}
+        for row in records:
+            settings_map.setdefault(str(row.get("courseId")), row)
+        return settings_map
+    except Exception as e:
+        st.error(f"설문 설정 로드 실패: {str(e)}")
+        return {}
+
+
 @st.cache_data(ttl=120)  # Cache for 2 minutes
 def get_course_items_cached(_spreadsheet, course_id: str):
     """
@@ -3162,23 +3789,51 @@ def get_course_items_cached(_spreadsheet, course_id: str):
     API Read 요청을 줄이고 쿼터 초과 에러를 방지합니다.
     """
     try:
-        # gsheets_utils의 get_course_items 함수 호출 (이 함수는 API를 사용함)
-        return get_course_items(_spreadsheet, course_id)
+        # gsheets_utils의 get_course_items 함수 호출 (스프레드시트가 변경된 경우에만 API 사용)
+        return _records_if_changed(
+            _spreadsheet,
+            cache_key=("course_items", course_id),
+            fetch=lambda: get_course_items(_spreadsheet, course_id),
+        )
     except Exception as e:
         # 문항 로드 실패 시 레거시 함수로 폴백하여 안정성 확보
         st.warning(f"get_course_items 실패. 레거시 list_questions으로 폴백: {str(e)}")
         return list_questions(_spreadsheet, course_id)
 
 
+@st.cache_data(ttl=120)  # Cache for 2 minutes
+def get_dashboard_data_cached(_spreadsheet, course_id: str) -> Dict:
+    """
+    대시보드용 과정/문항/응답을 values.batchGet 1회로 로드해 캐시합니다.
+
+    Returns:
+        {"course": 과정 dict, "questions": 문항 목록, "responses": get_responses_grouped_cached와 같은 그룹 구조}
+    """
+    course, questions, responses = _records_if_changed(
+        _spreadsheet,
+        cache_key=("dashboard", course_id),
+        fetch=lambda: batch_load_dashboard(_spreadsheet, course_id),
+    )
+    return {"course": course, "questions": questions, "responses": _group_responses(responses)}
+
+
 def page_dashboard(spreadsheet, course_id: str):
     """Dashboard page for analyzing survey results (v2 스키마 호환)"""
 
-    # 안전 조치: 모든 경로에서 all_course_responses 변수가 존재하도록 보장
-    all_course_responses = []
+    # 💡 과정/문항/응답을 한 번의 API 왕복으로 로드 (실패하거나 과정이 없으면 개별 로더로 폴백)
+    try:
+        dashboard_data = get_dashboard_data_cached(spreadsheet, course_id)
+        if not dashboard_data["course"]:
+            dashboard_data = None
+    except Exception:
+        dashboard_data = None
 
     # v2 스키마 시도
     try:
-        course_v2 = get_course_by_id_v2(spreadsheet, course_id)
+        if dashboard_data is not None:
+            course_v2 = dashboard_data["course"]
+        else:
+            course_v2 = get_course_by_id_v2(spreadsheet, course_id)
         if course_v2:
             use_v2 = True
         else:
@@ -3230,7 +3885,10 @@ def page_dashboard(spreadsheet, course_id: str):
     # 문항 조회 (v2 스키마 우선)
     try:
         # ⚠️ get_course_items 대신 캐시된 헬퍼 함수 호출
-        questions = get_course_items_cached(spreadsheet, course_id)
+        if dashboard_data is not None:
+            questions = dashboard_data["questions"]
+        else:
+            questions = get_course_items_cached(spreadsheet, course_id)
         
         if not questions:
             st.info("📝 설문 문항이 없습니다. '설문 편집'에서 문항을 추가하세요.")
@@ -3246,15 +3904,19 @@ def page_dashboard(spreadsheet, course_id: str):
     # 응답 조회 (v2 스키마 우선)
     # ⚠️ 주의: get_responses_v2가 Responses_v2 시트가 없어 실패하는 문제를 우회합니다.
     try:
-        # 1. 응답 데이터를 로드합니다 (시트 이름 문제 우회 로직 포함)
-        all_course_responses = get_all_responses_cached(spreadsheet, course_id)
-        
-        # 2. 로드된 데이터를 분석에 사용할 responses 변수에 할당합니다.
-        responses = all_course_responses
+        # 1. 응답 데이터를 item_id 기준으로 그룹화된 형태로 로드합니다 (시트 이름 문제 우회 로직 포함)
+        #    그룹화/응답자 집계까지 캐시되므로 재렌더링 시 전체 응답을 다시 훑지 않습니다.
+        if dashboard_data is not None:
+            grouped_responses = dashboard_data["responses"]
+        else:
+            grouped_responses = get_responses_grouped_cached(spreadsheet, course_id)
+
+        # 🔑 디버그 정보 (옵션을 켠 세션에서만 표시, 캐시 밖에서 렌더링)
+        _render_loader_debug(spreadsheet, course_id, grouped_responses["total"])
         
-        # 3. 로드된 데이터를 바탕으로 use_v2 플래그를 재설정합니다.
-        #    (Course 정보 조회 성공 여부와 관계없이 응답 데이터의 존재 여부를 우선 확인)
-        if not all_course_responses:
+        # 2. 로드된 데이터를 바탕으로 응답 데이터의 존재 여부를 우선 확인
+        #    (Course 정보 조회 성공 여부와 관계없이)
+        if not grouped_responses["total"]:
             st.warning("⚠️ 아직 응답 데이터가 없습니다.")
             st.info("💡 '일반 사용자 모드'에서 설문에 응답하거나, '파일 업로드' 탭에서 응답 데이터를 적재하세요.")
             return
@@ -3264,7 +3926,57 @@ def page_dashboard(spreadsheet, course_id: str):
         return
 
     # use_v2 플래그는 course_v2 조회 시 결정된 값을 사용합니다 (로딩 로직과 분리)
-    # all_course_responses 변수는 이제 분석 함수의 입력으로 사용됩니다.
+    # 문항별 응답 목록은 분석 함수의 입력으로 사용됩니다.
+    responses_by_item = grouped_responses["by_item"]
+    
+    # 💡 헬퍼 함수: v2의 metric_type을 우선하고 없으면 레거시 type을 반환
+    def get_q_type(q):
+        """v2의 metric_type을 우선하고 없으면 레거시 type을 반환"""
+        return (q.get('metric_type') or q.get('type') or 'unknown').lower()
+    
+    def get_q_text(q):
+        """v2의 item_text를 우선하고 없으면 레거시 text를 반환"""
+        return q.get('item_text') or q.get('text') or '(제목없음)'
+    
+    def get_q_id(q):
+        """v2의 item_id를 우선하고 없으면 레거시 questionId를 반환"""
+        return str(q.get('item_id') or q.get('questionId'))
+    
+    # 탭별 표시 문항 (v2 metric_type을 우선 사용한 통합 분류)
+    # 🔧 문항을 한 번만 순회하며 유형별 버킷 분류 + 중복 제거를 함께 처리
+    question_buckets = {'objective': [], 'rating': [], 'subjective': []}
+    seen_ids = set()
+    for q in questions:
+        q['_type'] = get_q_type(q)
+        bucket = _QTYPE_MAP.get(q['_type'])
+        if bucket is None:
+            continue
+        q_id = str(q.get('item_id') or q.get('questionId'))
+        if q_id in seen_ids:
+            continue
+        seen_ids.add(q_id)
+        # 문항 ID와 표시/필터용 텍스트는 한 번만 계산해 문항 dict에 보관 (탭마다 재계산 X)
+        q['_id'] = q_id
+        q['_category'] = bucket
+        q['_text_cached'] = str(get_q_text(q))
+        q['_text_lower'] = q['_text_cached'].lower()
+        question_buckets[bucket].append(q)
+    
+    # 💡 경품/개인정보 관련 문항 필터링 (미리 컴파일한 정규식 1회 검색)
+    objective_qs = [q for q in question_buckets['objective'] if not _EXCLUDE_RE.search(q['_text_lower'])]
+    rating_qs = question_buckets['rating']
+    subjective_qs = question_buckets['subjective']
+    
+    # 🔧 세 유형의 분석을 문항 1회 순회로 한꺼번에 계산 (KPI/탭/AI 인사이트에서 공유)
+    #    위젯 조작으로 인한 재실행에서는 캐시된 결과를 그대로 사용
+    analyzed_qs = objective_qs + rating_qs + subjective_qs
+    all_analysis = analyze_all_cached(
+        course_id,
+        tuple(q['_id'] for q in analyzed_qs),
+        grouped_responses["total"],
+        analyzed_qs,
+        responses_by_item,
+    )
     
     # KPI Summary - SVG 아이콘 사용
     st.markdown('''
@@ -3289,29 +4001,17 @@ def page_dashboard(spreadsheet, course_id: str):
     col1, col2, col3 = st.columns(3)
     
     try:
-        # 안전하게 respondentHash 추출 (v2와 레거시 호환)
-        respondent_hashes = set()
-        for r in responses:
-            hash_val = r.get('respondentHash') or r.get('respondent_id')
-            if hash_val:
-                respondent_hashes.add(str(hash_val))
-        
-        unique_respondents = len(respondent_hashes)
+        unique_respondents = grouped_responses["unique_respondents"]
         total_questions = len(questions)
         
-        # 📈 핵심 KPI: 평점형 문항의 전체 평균 계산
-        rating_qs = [q for q in questions if (q.get('metric_type') or q.get('type') or '').lower() in ['rating', 'likert', 'nps']]
+        # 📈 핵심 KPI: 평점형 문항의 전체 평균 계산 (미리 계산된 분석 결과 재사용)
         overall_satisfaction = 0.0
-        if rating_qs:
-            total_avg = 0.0
-            valid_count = 0
-            for q in rating_qs:
-                data = analyze_rating_data(spreadsheet, course_id, q, all_course_responses)
-                if not data.get('no_data') and data.get('average', 0) > 0:
-                    total_avg += data.get('average', 0)
-                    valid_count += 1
-            if valid_count > 0:
-                overall_satisfaction = total_avg / valid_count
+        rating_averages = [
+            data.get('average', 0) for data in all_analysis['rating'].values()
+            if not data.get('no_data') and data.get('average', 0) > 0
+        ]
+        if rating_averages:
+            overall_satisfaction = sum(rating_averages) / len(rating_averages)
         
         with col1:
             st.metric("총 응답자 수", unique_respondents)
@@ -3339,49 +4039,12 @@ def page_dashboard(spreadsheet, course_id: str):
         "AI 인사이트"
     ])
     
-    all_analysis = {
-        'objective': {},
-        'rating': {},
-        'subjective': {}
-    }
-    
-    # 💡 헬퍼 함수: v2의 metric_type을 우선하고 없으면 레거시 type을 반환
-    def get_q_type(q):
-        """v2의 metric_type을 우선하고 없으면 레거시 type을 반환"""
-        return (q.get('metric_type') or q.get('type') or 'unknown').lower()
-    
-    def get_q_text(q):
-        """v2의 item_text를 우선하고 없으면 레거시 text를 반환"""
-        return q.get('item_text') or q.get('text') or '(제목없음)'
-    
-    def get_q_id(q):
-        """v2의 item_id를 우선하고 없으면 레거시 questionId를 반환"""
-        return str(q.get('item_id') or q.get('questionId'))
-    
-    def deduplicate_questions(question_list: List[Dict]) -> List[Dict]:
-        seen_ids = set()
-        unique_list = []
-        for q in question_list:
-            q_id = get_q_id(q)
-            if q_id in seen_ids:
-                continue
-            seen_ids.add(q_id)
-            unique_list.append(q)
-        return unique_list
-
-    # 응답을 item_id 기준으로 그룹화
-    responses_by_item = defaultdict(list)
-    for resp in all_course_responses:
-        resp_key = str(resp.get("item_id") or resp.get("questionId"))
-        if resp_key:
-            responses_by_item[resp_key].append(resp)
-
-    unique_question_ids = {get_q_id(q) for q in questions if get_q_id(q)}
+    unique_question_ids = {q_id for q in questions if (q_id := get_q_id(q))}
 
     with st.expander("데이터 상태 요약", expanded=False):
         st.write("- 총 문항 수 (Course_Item_Map):", len(questions))
         st.write("- 고유 문항 수:", len(unique_question_ids))
-        st.write("- 응답 레코드 수:", len(all_course_responses))
+        st.write("- 응답 레코드 수:", grouped_responses["total"])
         st.write("- 응답이 있는 문항 수:", len({k for k, v in responses_by_item.items() if v}))
 
     with tab1:
@@ -3397,42 +4060,38 @@ def page_dashboard(spreadsheet, course_id: str):
             </h3>
         ''', unsafe_allow_html=True)
         
-        # v2 metric_type을 우선 사용한 통합 분류
-        objective_qs = [q for q in questions if get_q_type(q) in ['objective', 'single_choice', 'multi_choice']]
-        objective_qs = deduplicate_questions(objective_qs)
-        
-        # 💡 경품/개인정보 관련 문항 필터링
-        exclude_keywords = ["경품", "개인정보", "동의", "수집", "이용", "제공", "consent", "privacy", "prize"]
-        objective_qs = [q for q in objective_qs 
-                       if not any(keyword in get_q_text(q).lower() for keyword in exclude_keywords)]
-        
         if not objective_qs:
             st.info("객관식 문항이 없습니다.")
         else:
+            # 💡 문항별 차트를 따로 그리지 않고, 탭 전체를 하나의 서브플롯 Figure로 렌더링
+            chart_items = []
+            empty_titles = []
             for q in objective_qs:
-                q_text = get_q_text(q)
-                q_id = get_q_id(q)
-                related_responses = responses_by_item.get(q_id, [])
-
-                st.markdown(f"#### {q_text}")
-
-                if not related_responses:
-                    st.info("응답 데이터가 없습니다. (0건)")
-                    st.divider()
-                    continue
-
-                data = analyze_objective_data(spreadsheet, course_id, q, all_course_responses)
-                all_analysis['objective'][q_id] = data
-
-                if data.get('no_data'):
-                    st.info("응답 데이터가 없습니다.")
+                data = all_analysis['objective'].get(q['_id'])
+                if not data or data.get('no_data'):
+                    empty_titles.append(q['_text_cached'])
                 else:
-                    st.caption(f"응답 수: {len(related_responses)}")
-                    df = pd.DataFrame(list(data['counts'].items()), columns=['선택지', '응답 수'])
-                    fig = px.bar(df, x='선택지', y='응답 수', title=f"총 응답: {data['total']}")
-                    st.plotly_chart(fig, use_container_width=True, key=f"obj_chart_{q_id}")
+                    chart_items.append((q['_text_cached'], data))
 
-                st.divider()
+            if chart_items:
+                fig = make_subplots(
+                    rows=len(chart_items),
+                    cols=1,
+                    subplot_titles=[f"{q_text} (총 응답: {data['total']})" for q_text, data in chart_items],
+                )
+                for row, (_, data) in enumerate(chart_items, start=1):
+                    fig.add_trace(
+                        go.Bar(x=list(data['counts'].keys()), y=list(data['counts'].values()), name="응답 수"),
+                        row=row, col=1,
+                    )
+                fig.update_layout(height=320 * len(chart_items), showlegend=False)
+                st.plotly_chart(fig, use_container_width=True, key="obj_chart_all")
+
+            if empty_titles:
+                st.info(
+                    f"응답 데이터가 없는 문항 ({len(empty_titles)}개)\n\n"
+                    + "\n".join(f"- {q_text}" for q_text in empty_titles)
+                )
     
     with tab2:
         st.markdown('''
@@ -3444,46 +4103,59 @@ def page_dashboard(spreadsheet, course_id: str):
             </h3>
         ''', unsafe_allow_html=True)
         
-        # v2 metric_type을 우선 사용한 통합 분류
-        rating_qs = [q for q in questions if get_q_type(q) in ['rating', 'likert', 'nps']]
-        rating_qs = deduplicate_questions(rating_qs)
-        
         if not rating_qs:
             st.info("평점형 문항이 없습니다.")
         else:
+            # 💡 평점 분포 파이 차트도 탭 전체를 하나의 서브플롯 Figure로 렌더링
+            chart_items = []
+            empty_titles = []
             for q in rating_qs:
-                q_text = get_q_text(q)
-                q_id = get_q_id(q)
-
-                related_responses = responses_by_item.get(q_id, [])
-
-                st.markdown(f"#### {q_text}")
-
-                if not related_responses:
-                    st.info("응답 데이터가 없습니다. (0건)")
-                    st.divider()
-                    continue
-
-                data = analyze_rating_data(spreadsheet, course_id, q, all_course_responses)
-                all_analysis['rating'][q_id] = data
-                
-                if data.get('no_data'):
-                    st.info("응답 데이터가 없습니다.")
+                data = all_analysis['rating'].get(q['_id'])
+                if not data or data.get('no_data'):
+                    empty_titles.append(q['_text_cached'])
                 else:
-                    st.caption(f"응답 수: {len(related_responses)}")
-                    col_a, col_b = st.columns([2, 1])
-                    
-                    with col_a:
-                        df = pd.DataFrame(list(data['counts'].items()), columns=['평점', '응답 수'])
-                        df['평점'] = df['평점'].astype(str) + '점'
-                        fig = px.pie(df, names='평점', values='응답 수', title=f"평점 분포 (평균: {data['average']:.2f}점)")
-                        st.plotly_chart(fig, use_container_width=True, key=f"rating_chart_{q_id}")
-                    
-                    with col_b:
-                        st.metric("평균 평점", f"{data['average']:.2f}점")
-                        st.metric("총 응답 수", data['total'])
+                    chart_items.append((q['_text_cached'], data))
+
+            if chart_items:
+                # 문항별 평균/응답 수 요약
+                st.dataframe(
+                    pd.DataFrame({
+                        "문항": [q_text for q_text, _ in chart_items],
+                        "평균 평점": [round(data['average'], 2) for _, data in chart_items],
+                        "총 응답 수": [data['total'] for _, data in chart_items],
+                    }),
+                    hide_index=True,
+                    use_container_width=True,
+                )
 
-                st.divider()
+                fig = make_subplots(
+                    rows=len(chart_items),
+                    cols=1,
+                    # 💡 평점 종류가 많으면 파이 대신 가벼운 가로 막대(xy 서브플롯)로 표시
+                    specs=[
+                        [{"type": "domain" if len(data['counts']) <= PIE_MAX_SLICES else "xy"}]
+                        for _, data in chart_items
+                    ],
+                    subplot_titles=[
+                        f"{q_text} (평균: {data['average']:.2f}점)" for q_text, data in chart_items
+                    ],
+                )
+                for row, (_, data) in enumerate(chart_items, start=1):
+                    labels = [f"{rating}점" for rating in data['counts']]
+                    values = list(data['counts'].values())
+                    if len(labels) <= PIE_MAX_SLICES:
+                        trace = go.Pie(labels=labels, values=values)
+                    else:
+                        trace = go.Bar(x=values, y=labels, orientation='h', showlegend=False)
+                    fig.add_trace(trace, row=row, col=1)
+                fig.update_layout(height=360 * len(chart_items))
+                st.plotly_chart(fig, use_container_width=True, key="rating_chart_all")
+
+            if empty_titles:
+                st.info(
+                    f"응답 데이터가 없는 문항 ({len(empty_titles)}개)\n\n"
+                    + "\n".join(f"- {q_text}" for q_text in empty_titles)
+                )
     
     with tab3:
         st.markdown('''
@@ -3497,45 +4169,47 @@ def page_dashboard(spreadsheet, course_id: str):
             </h3>
         ''', unsafe_allow_html=True)
         
-        # v2 metric_type을 우선 사용한 통합 분류
-        subjective_qs = [q for q in questions if get_q_type(q) in ['subjective', 'text']]
-        subjective_qs = deduplicate_questions(subjective_qs)
-        
         if not subjective_qs:
             st.info("주관식 문항이 없습니다.")
         else:
             for q in subjective_qs:
-                q_text = get_q_text(q)
-                q_id = get_q_id(q)
-                related_responses = responses_by_item.get(q_id, [])
-                
-                st.markdown(f"#### {q_text}")
-                if not related_responses:
+                q_id = q['_id']
+                st.markdown(f"#### {q['_text_cached']}")
+
+                # 응답이 없는 문항은 analyze_all 결과에 없으므로 바로 건너뜀
+                data = all_analysis['subjective'].get(q_id)
+                texts = data.get('responses') if data else None
+                if not texts:
                     st.info("응답 데이터가 없습니다. (0건)")
                     st.divider()
                     continue
 
-                data = analyze_subjective_data(spreadsheet, course_id, q, all_course_responses)
-                all_analysis['subjective'][q_id] = data
+                st.caption(f"응답 수: {len(texts)}")
                 
-                if data.get('no_data'):
-                    st.info("응답 데이터가 없습니다.")
-                else:
-                    texts = data['responses']
-                    st.caption(f"응답 수: {len(texts)}")
-                    
-                    if len(texts) >= 5:
-                        # Wordcloud
-                        st.markdown("##### 워드 클라우드")
-                        fig = generate_wordcloud(texts)
-                        if fig:
-                            st.pyplot(fig)
-                    
-                    # Show responses
-                    st.markdown(f"##### 전체 응답 ({len(texts)}개)")
-                    with st.expander("응답 보기"):
-                        for idx, text in enumerate(texts, 1):
-                            st.markdown(f"{idx}. {text}")
+                if len(texts) >= 5:
+                    # Wordcloud
+                    st.markdown("##### 워드 클라우드")
+                    wordcloud_png = generate_wordcloud(tuple(texts))
+                    if wordcloud_png:
+                        st.image(wordcloud_png, use_container_width=True)
+                
+                # Show responses
+                st.markdown(f"##### 전체 응답 ({len(texts)}개)")
+                with st.expander("응답 보기"):
+                    # 💡 응답마다 st.markdown을 호출하지 않고 목록 전체를 한 번에 렌더링
+                    st.markdown("\n".join(
+                        f"{idx}. {' '.join(text.splitlines())}"
+                        for idx, text in enumerate(texts[:SUBJECTIVE_DISPLAY_LIMIT], 1)
+                    ))
+                    if len(texts) > SUBJECTIVE_DISPLAY_LIMIT:
+                        st.caption(f"처음 {SUBJECTIVE_DISPLAY_LIMIT}개만 표시합니다. 전체 응답은 파일로 내려받으세요.")
+                        st.download_button(
+                            "전체 응답 다운로드 (.txt)",
+                            data="\n".join(texts).encode("utf-8"),
+                            file_name=f"{course_id}_{q_id}_responses.txt",
+                            mime="text/plain",
+                            key=f"subj_download_{q_id}",
+                        )
                 
                 st.divider()
     
@@ -3555,46 +4229,92 @@ def page_dashboard(spreadsheet, course_id: str):
         
         if st.button("AI 분석 실행", type="primary"):
             with st.spinner("Gemini AI로 분석 중..."):
-                # v2와 레거시 통합 호환
-                insights = generate_ai_insights(spreadsheet, course_id, questions, all_analysis)
-                
                 st.markdown("#### 분석 결과")
-                st.markdown(insights)
+                # v2와 레거시 통합 호환 (결과는 생성되는 대로 스트리밍 출력)
+                insights = generate_ai_insights(spreadsheet, course_id, questions, all_analysis)
                 
                 # Save to Analysis sheet (v2는 Insights 시트 사용 가능)
                 if use_v2:
                     # v2 스키마: Insights 시트에 저장
                     try:
                         insight_data = {
-                            "insight_id": f"INS-{int(datetime.now(timezone.utc).timestamp())}",
+                            "insight_id": f"INS-{time.time_ns() // 1_000_000_000}",
                             "course_id": course_id,
                             "insight_type": "ai_generated",
                             "insight_text": insights,
                             "dimension": "overall",
                             "sentiment_score": None,
                             "created_at": datetime.now(timezone.utc).isoformat(),
-                            "metadata": json.dumps({
+                            "metadata": _dumps_json({
                                 "objective": all_analysis['objective'],
                                 "rating": all_analysis['rating'],
-                                "subjective_count": {k: v.get('total', 0) for k, v in all_analysis['subjective'].items()}
-                            }, ensure_ascii=False)
+                                "subjective_count": all_analysis['subjective_count']
+                            })
                         }
-                        save_insight(spreadsheet, insight_data)
-                        st.success("✅ 분석 결과가 Insights 시트에 저장되었습니다.")
+                        _submit_background_save(
+                            "Insights", save_insight, spreadsheet, insight_data
+                        )
                     except Exception as e:
                         st.warning(f"⚠️ Insights 저장 실패: {str(e)}")
                 else:
                     # 레거시 스키마: Analysis 시트에 저장
                     analysis_data = {
-                        "objectiveJson": json.dumps(all_analysis['objective'], ensure_ascii=False),
-                        "ratingJson": json.dumps(all_analysis['rating'], ensure_ascii=False),
-                        "subjectiveJson": json.dumps(all_analysis['subjective'], ensure_ascii=False),
+                        "objectiveJson": _dumps_json(all_analysis['objective']),
+                        "ratingJson": _dumps_json(all_analysis['rating']),
+                        "subjectiveJson": _dumps_json(all_analysis['subjective']),
                         "insightsText": insights,
                         "actionItemsText": "",
                         "confidence": "0.85"
                     }
-                    save_analysis(spreadsheet, course_id, analysis_data)
-                    st.success("✅ 분석 결과가 Analysis 시트에 저장되었습니다.")
+                    _submit_background_save(
+                        "Analysis", save_analysis, spreadsheet, course_id, analysis_data
+                    )
+
+        # 백그라운드로 넘긴 저장 작업 상태 표시 (방금 제출한 저장도 같은 실행에서 폴링 시작)
+        _report_background_save()
+
+
+def _submit_background_save(sheet_label: str, save_fn, *args) -> None:
+    """시트 저장을 백그라운드 스레드로 넘기고, 진행/결과는 _report_background_save가 표시
+
+    💡 저장이 끝나기 전에 다시 분석을 실행해도 이전 저장 결과가 사라지지 않도록 목록으로 보관합니다.
+    """
+    future = _SAVE_POOL.submit(save_fn, *args)
+    st.session_state.setdefault("_pending_saves", []).append(
+        {"label": sheet_label, "future": future, "shown": False}
+    )
+
+
+def _render_background_saves() -> None:
+    """백그라운드 저장 작업별 진행/완료 메시지 표시 (완료 메시지는 다음 전체 재실행까지 유지)"""
+    for entry in st.session_state.get("_pending_saves", []):
+        sheet_label, future = entry["label"], entry["future"]
+        if not future.done():
+            st.info(f"💾 분석 결과를 {sheet_label} 시트에 저장 중입니다...")
+            continue
+        entry["shown"] = True
+        error = future.exception()
+        if error is None:
+            st.success(f"✅ 분석 결과가 {sheet_label} 시트에 저장되었습니다.")
+        else:
+            st.warning(f"⚠️ {sheet_label} 저장 실패: {str(error)}")
+
+
+# 💡 저장 중인 작업이 있을 때만 이 fragment로 1초마다 상태 영역만 다시 그려,
+#    사용자가 다른 조작을 하지 않아도 저장 완료/실패 메시지가 스스로 나타나게 합니다.
+_poll_background_saves = st.fragment(run_every=1)(_render_background_saves)
+
+
+def _report_background_save() -> None:
+    """이미 표시한 완료 결과를 정리하고, 남은 저장 작업 상태를 표시"""
+    pending = [e for e in st.session_state.get("_pending_saves", []) if not e["shown"]]
+    st.session_state["_pending_saves"] = pending
+    if not pending:
+        return
+    if all(e["future"].done() for e in pending):
+        _render_background_saves()
+    else:
+        _poll_background_saves()
 
 
 def main():
@@ -3602,55 +4322,7 @@ def main():
     apply_global_styles()
     
     # 파스텔 배경 장식 추가
-    st.markdown(
-        """
-        <div class="ai-bg-decoration"></div>
-        <style>
-          /* 선형 패턴 장식 */
-          .stApp::before {
-            content: '';
-            position: fixed;
-            top: 10%;
-            right: 5%;
-            width: 150px;
-            height: 150px;
-            background-image: 
-              repeating-linear-gradient(45deg, transparent, transparent 15px, rgba(168, 216, 234, 0.1) 15px, rgba(168, 216, 234, 0.1) 30px),
-              repeating-linear-gradient(-45deg, transparent, transparent 15px, rgba(212, 165, 216, 0.1) 15px, rgba(212, 165, 216, 0.1) 30px);
-            border-radius: 50%;
-            z-index: 0;
-            pointer-events: none;
-            animation: pattern-rotate 30s linear infinite;
-          }
-          
-          .stApp::after {
-            content: '';
-            position: fixed;
-            bottom: 15%;
-            left: 8%;
-            width: 100px;
-            height: 100px;
-            border: 3px solid var(--pastel-mint);
-            border-radius: 50%;
-            z-index: 0;
-            pointer-events: none;
-            animation: float 8s ease-in-out infinite;
-            opacity: 0.3;
-          }
-          
-          @keyframes pattern-rotate {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-          }
-          
-          @keyframes float {
-            0%, 100% { transform: translateY(0px) scale(1); }
-            50% { transform: translateY(-25px) scale(1.05); }
-          }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+    inject_background_decoration()
     
     spreadsheet = require_spreadsheet()
     